@@ -25,25 +25,40 @@ License: Proprietary (Anonymized for portfolio purposes)
 """
 
 import os
+import sys
 import logging
+import logging.handlers
+import queue
+import weakref
 from string import Template
 import threading
 from typing import Optional, Any, Union, Iterator
 from datetime import datetime, timedelta, timezone
 from enum import IntEnum
+import glob
 import re
 import shutil
 import hashlib
-import random
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import gc
 import numpy as np
-from time import sleep
 import traceback
 import psutil
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 import tqdm
 import concurrent
-from functools import partial
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from collections import deque
+from itertools import islice, zip_longest
 
 
 from logger_lib import (
@@ -81,16 +96,31 @@ class VerbosityLevel(IntEnum):
     FULL_LOGGING = 4
 
 
-HOUR_CONDITION_TEMPLATE = {
-    "regular": Template(
-        "AND `${default_timeield}` >= '${start_time_str}Z' AND "
-        "`${default_timeield}` < '${end_time_str}Z'"
-    ),
-    "extra": Template(
-        "AND (`${default_timeield}` < '${start_time_str}Z' OR "
-        "`${default_timeield}` >= '${end_time_str}Z')"
-    ),
-}
+_FIELDS_RE = re.compile(r"^(\`[\w.$@]+\`|[\w.$@]+)(, (\`[\w.$@]+\`|[\w.$@]+))*$")
+_ISO_MS_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z")
+_INDEX_DATE_RE = re.compile(r"\d{4}(?:\.\d{2}){1,2}")
+# Field names as they come back in result frames: no "@", no backticks, "." -> "_"
+_FIELD_NAME_TABLE = str.maketrans({"@": "", ".": "_", "`": ""})
+
+
+def regular_hour_condition(
+    default_timeield: str, start_time_str: str, end_time_str: str
+) -> str:
+    """Builds the condition selecting documents inside [start, end)."""
+    return (
+        f"AND `{default_timeield}` >= '{start_time_str}Z' AND "
+        f"`{default_timeield}` < '{end_time_str}Z'"
+    )
+
+
+def extra_hour_condition(
+    default_timeield: str, start_time_str: str, end_time_str: str
+) -> str:
+    """Builds the condition selecting documents outside of [start, end)."""
+    return (
+        f"AND (`{default_timeield}` < '{start_time_str}Z' OR "
+        f"`{default_timeield}` >= '{end_time_str}Z')"
+    )
 
 
 def set_gte_lte(gte: datetime, lte: datetime):
@@ -112,13 +142,18 @@ def set_gte_lte(gte: datetime, lte: datetime):
     if not isinstance(lte, datetime):
         raise ValueError("Parameter 'lte' must be a datetime object.")
 
-    gte = gte.astimezone(timezone.utc)
-    lte = lte.astimezone(timezone.utc)
+    return _to_utc_iso_ms(gte), _to_utc_iso_ms(lte)
 
-    gte_str = gte.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] if gte else None
-    lte_str = lte.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] if lte else None
 
-    return gte_str, lte_str
+def _to_utc_iso_ms(dt: datetime) -> str:
+    """Formats a datetime as a UTC `YYYY-MM-DDTHH:MM:SS.mmm` string."""
+    # Naive datetimes are local time, aware ones only need converting off UTC
+    if dt.tzinfo is None or dt.utcoffset() != timedelta(0):
+        dt = dt.astimezone(timezone.utc)
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}"
+    )
 
 
 class QueryConfigurator:
@@ -155,6 +190,7 @@ class QueryConfigurator:
         date_range: Optional[str] = None,
         ignore_exceptions: bool = False,
         isin_container: bool = False,
+        arrow_csv: bool = False,
     ):
         """
         Initializes the QueryConfigurator instance with query parameters and runtime options.
@@ -165,7 +201,7 @@ class QueryConfigurator:
             name_of_type (str): Name of the type field used in filtering.
             event_type (str): Value of the event type filter.
             extra_condition (str): Additional condition appended to each query.
-            output_filename (str | None): Path to output file (CSV). If None, default name will be used.
+            output_filename (str | None): Path to output file (.csv or .parquet). If None, default name will be used.
             verbose (VerbosityLevel): Controls the level of logging verbosity.
             ascending (bool): Whether the output should be sorted in ascending time order.
             temp_files (bool): Whether to store intermediate files for reuse.
@@ -177,6 +213,7 @@ class QueryConfigurator:
             date_range (str | None): Name of the time field used in filtering.
             ignore_exceptions (bool): If True, continues execution on failure; if False, stops on first exception.
             isin_container (bool): Enables container-safe behavior (disables memory tracking/logging if True).
+            arrow_csv (bool): Writes the CSV with pyarrow's writer (faster; quotes all strings, ISO timestamps, lowercase booleans).
 
         Raises:
             ValueError: If any of the parameters are invalid or have wrong types.
@@ -208,6 +245,7 @@ class QueryConfigurator:
         validate_type(ignore_exceptions, bool, "'ignore_exceptions' must be a boolean.")
         validate_type(isin_container, bool, "'isin_container' must be a boolean.")
         validate_type(compress_df, bool, "'compress_df' must be a boolean.")
+        validate_type(arrow_csv, bool, "'arrow_csv' must be a boolean.")
 
         validate_fields(fields)
 
@@ -219,6 +257,9 @@ class QueryConfigurator:
         self.query_template = Template(
             f"SELECT $fields FROM `$index` WHERE {self.name_of_type}='$type' $extra_condition"
         )
+        # Constant parts of every query, so get_query is a plain concatenation
+        self._query_prefix = f"SELECT {fields} FROM `"
+        self._query_suffix = f"` WHERE {name_of_type}='{event_type}' {extra_condition} "
         self.indexes = indexes
         self.fields = fields
         self.event_type = event_type
@@ -227,10 +268,12 @@ class QueryConfigurator:
         self.verbose = verbose
         self.ascending = ascending
         self.logger = None
+        self._log_listener = None
         self.isin_container = isin_container
         self.temp_files = temp_files and not isin_container
         self.return_df = return_df
         self.compress_df = compress_df
+        self.arrow_csv = arrow_csv
         self.gte, self.lte = set_gte_lte(gte, lte)
         self.date_range = date_range
         self.ignore_exceptions = ignore_exceptions
@@ -250,6 +293,9 @@ class QueryConfigurator:
         """
         Creates a logger for the configurator, if verbosity is enabled.
 
+        Records are put on a queue and written to the log file by a background
+        listener thread, so download workers never wait on file I/O.
+
         Returns:
             logging.Logger: Configured logger object.
         """
@@ -260,9 +306,40 @@ class QueryConfigurator:
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter("%(message)s")
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        log_queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        logger.addHandler(self._queue_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        # Flushes the queue if close() is never called explicitly
+        self._log_finalizer = weakref.finalize(
+            self, _stop_log_listener, self._log_listener, file_handler
+        )
         return logger
 
+    def flush_log(self) -> None:
+        """
+        Waits until every queued log record is written to the log file.
+        The listener is restarted, so the configurator keeps logging.
+        """
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        self._log_listener.start()
+
+    def close(self) -> None:
+        """
+        Flushes pending log records and closes the log file.
+        """
+        if self._log_listener is None:
+            return
+        self.logger.removeHandler(self._queue_handler)
+        self._log_finalizer()
+        self._log_listener = None
+
     def get_query(self, index: str, hour_condition: str) -> str:
         """
         Constructs a query string based on the index and hour condition.
@@ -275,12 +352,7 @@ class QueryConfigurator:
         Returns:
             str: The constructed query string.
         """
-        return self.query_template.substitute(
-            fields=self.fields,
-            index=index,
-            type=self.event_type,
-            extra_condition=self.extra_condition + " " + hour_condition,
-        )
+        return self._query_prefix + index + self._query_suffix + hour_condition
 
     def log_debug(self, message: str, console=False) -> None:
         if console and self.verbose < 4:
@@ -328,9 +400,7 @@ def validate_type(
 
 
 def validate_fields(fields: str):
-    pattern = r"^(\`[\w.$@]+\`|[\w.$@]+)(, (\`[\w.$@]+\`|[\w.$@]+))*$"
-
-    if not re.match(pattern, fields):
+    if not _FIELDS_RE.match(fields):
         raise ValueError(f"Invalid format: {fields}")
     return True
 
@@ -340,7 +410,7 @@ def summary(
     start_exec_time: datetime,
     success_count: int,
     error_count: int,
-    peak_memory_usage: list[float],
+    peak_memory_usage: float,
 ):
     # Calculate execution duration
     end_exec_time = datetime.now()
@@ -350,26 +420,62 @@ def summary(
     placeholder = "-----------------"
     execution_time_message = f"Execution time: {exec_duration} seconds"
     success_error_message = f"Successes: {success_count}, Errors: {error_count}"
-    peak_memory_message = f"Peak memory usage: {peak_memory_usage[0]:.2f} MB"
+    peak_memory_message = f"Peak memory usage: {peak_memory_usage:.2f} MB"
 
     # Logging to file
     configurator.log_info(placeholder, console=True)
     configurator.log_info(execution_time_message, console=True)
     configurator.log_info(success_error_message, console=True)
 
-    if peak_memory_usage[0] > 0:
+    if peak_memory_usage > 0:
         configurator.log_info(peak_memory_message, console=True)
 
 
+def get_peak_memory_usage() -> float:
+    """
+    Returns the peak resident memory of the process in megabytes.
+
+    The kernel already tracks the high-water mark, so no sampling thread is needed.
+    Note that this is the peak over the whole process lifetime.
+    """
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+        if sys.platform == "darwin":
+            return max_rss / (1024**2)
+        return max_rss / 1024
+    return psutil.Process(os.getpid()).memory_info().peak_wset / (1024**2)
+
+
 def create_cache_dir(configurator: QueryConfigurator):
     # Base temporary directory
     temp_dir = os.path.join(os.getcwd(), "cache_storage")
     configurator.log_info(f"Temporary directory path: {temp_dir}")
     os.makedirs(temp_dir, exist_ok=True)
 
+    # Earlier versions renamed caches to "<name>.<pid>.<thread>.trash" and removed
+    # them in the background, which could be cut short at interpreter exit
+    for trash_dir in glob.glob(os.path.join(temp_dir, "*.trash")) + glob.glob(
+        os.path.join(temp_dir, "*", "*.trash")
+    ):
+        delete_directory(configurator, trash_dir)
+
     # Generate unique subdirectory name based on configuration
     unique_dir_name = generate_unique_dir_name(configurator)
-    nested_dir = os.path.join(temp_dir, unique_dir_name)
+    # Sharded like git objects, so cache_storage itself stays small
+    nested_dir = os.path.join(temp_dir, unique_dir_name[:2], unique_dir_name[2:])
+
+    # Caches of the former flat layout are named by MD5 and hold pickles that are
+    # no longer read; they are removed only when caches are not being kept
+    legacy_dir = os.path.join(temp_dir, generate_legacy_dir_name(configurator))
+    if os.path.isdir(legacy_dir):
+        if configurator.temp_files:
+            configurator.log_info(
+                f"Cache {legacy_dir} of the former layout is kept but no longer read"
+            )
+        else:
+            configurator.log_info(f"Removing cache {legacy_dir} of the former layout")
+            delete_directory(configurator, legacy_dir)
 
     # Check if directory already exists
     is_old_cache = os.path.exists(nested_dir)
@@ -384,7 +490,7 @@ def create_cache_dir(configurator: QueryConfigurator):
 
 def generate_unique_dir_name(configurator: QueryConfigurator) -> str:
     """
-    Generates a unique directory name based on configuration parameters using MD5 hashing.
+    Generates a unique directory name based on configuration parameters using BLAKE2b hashing.
 
     Args:
         configurator (QueryConfigurator): Configuration object containing relevant parameters.
@@ -392,8 +498,24 @@ def generate_unique_dir_name(configurator: QueryConfigurator) -> str:
     Returns:
         str: A unique hashed directory name.
     """
-    # Concatenate config parameters to form a base string for hashing
-    base_string = (
+    # 16-byte BLAKE2b digest keeps the 32-character name of the former MD5 one
+    hash_object = hashlib.blake2b(
+        _cache_base_string(configurator).encode("utf-8"), digest_size=16
+    )
+    return hash_object.hexdigest()
+
+
+def generate_legacy_dir_name(configurator: QueryConfigurator) -> str:
+    """MD5 directory name under which earlier versions cached the same configuration."""
+    hash_object = hashlib.md5(
+        _cache_base_string(configurator).encode("utf-8"), usedforsecurity=False
+    )
+    return hash_object.hexdigest()
+
+
+def _cache_base_string(configurator: QueryConfigurator) -> str:
+    """Concatenates the config parameters that identify a cache."""
+    return (
         configurator.fields
         + configurator.name_of_type
         + configurator.event_type
@@ -401,10 +523,6 @@ def generate_unique_dir_name(configurator: QueryConfigurator) -> str:
         + str(configurator.time_step)
     )
 
-    # Generate MD5 hash
-    hash_object = hashlib.md5(base_string.encode("utf-8"))
-    return hash_object.hexdigest()
-
 
 def delete_directory(configurator: QueryConfigurator, directory: str):
     if os.path.isdir(directory):
@@ -445,8 +563,15 @@ def write_instance_info(instance: QueryConfigurator, file_path: str):
     instance.log_info(f"File {complete_file_path} with query parameters is created.")
 
 
+def _stop_log_listener(
+    listener: logging.handlers.QueueListener, handler: logging.Handler
+) -> None:
+    listener.stop()
+    handler.close()
+
+
 def generate_logfile_name(base_filename: str) -> str:
-    return "query_" + base_filename.replace(".csv", ".log")
+    return "query_" + os.path.splitext(base_filename)[0] + ".log"
 
 
 def move_query_log_file(configurator: QueryConfigurator, temp_dir: str):
@@ -462,27 +587,32 @@ def move_query_log_file(configurator: QueryConfigurator, temp_dir: str):
     # Проверяем, существует ли файл в текущей рабочей директории
     if os.path.exists(source_file):
         try:
-            # Перемещаем файл в целевую директорию
-            shutil.move(source_file, destination_file)
-        except Exception:
-            pass
+            # Перемещаем файл в целевую директорию; на одной ФС это один rename
+            os.replace(source_file, destination_file)
+        except OSError:
+            # Разные файловые системы: копирование с удалением
+            try:
+                shutil.move(source_file, destination_file)
+            except Exception:
+                pass
 
 
+@lru_cache(maxsize=4096)
 def extract_date_from_index(index: str) -> datetime:
     """Функция для извлечения даты из строки индекса.
     Возвращает минимально возможную дату для индексов без даты."""
     try:
         # Ищем датаформаты в строке индекса
-        match = re.search(r"\d{4}(\.\d{2}){1,2}", index)
+        match = _INDEX_DATE_RE.search(index)
         if not match:
             return datetime.min
 
-        date_str = match.group(0)
+        # Формат ГГГГ.ММ или ГГГГ.ММ.ДД, разбираем без strptime
+        parts = [int(part) for part in match.group(0).split(".")]
 
-        if len(date_str) == 7:  # Формат ГГГГ.ММ
-            return datetime.strptime(date_str, "%Y.%m")
-        if len(date_str) == 10:  # Формат ГГГГ.ММ.ДД
-            return datetime.strptime(date_str, "%Y.%m.%d")
+        if len(parts) == 2:
+            return datetime(parts[0], parts[1], 1)
+        return datetime(parts[0], parts[1], parts[2])
     except Exception:
         return datetime.min
 
@@ -493,11 +623,7 @@ def change_time_format(condition: str) -> str:
         dt = datetime.fromisoformat(iso_format_date.replace("Z", "+00:00"))
         return dt.strftime("%Y-%m-%d %H:%M:%S.%f")
 
-    new_condition = re.sub(
-        r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z",
-        convert_datetime_format,
-        condition,
-    )
+    new_condition = _ISO_MS_RE.sub(convert_datetime_format, condition)
     return new_condition
 
 
@@ -511,7 +637,8 @@ def prepare_queries(
     if configurator.date_range:
         default_timeield = configurator.date_range
 
-    result_queries = []
+    # Queries are kept per index and interleaved at the end
+    queries_by_index = []
 
     for ind in configurator.indexes:
         configurator.log_debug(f"Preparing queries for index {ind}...")
@@ -520,27 +647,34 @@ def prepare_queries(
 
         date_part = ind.split("-")[1] if "-" in ind else None
 
+        result_queries = []
+        queries_by_index.append(result_queries)
+
         if not date_part:
             handle_index_without_date(
                 ind, nested_dir, configurator, result_queries, default_timeield
             )
-            return result_queries
+            break
 
-        start_date, end_date, is_compressed_index = parse_date_from_index(date_part)
+        start_date, end_date, _ = parse_date_from_index(date_part)
 
         create_queries_for_date_range(
             configurator,
             ind,
             start_date,
             end_date,
-            is_compressed_index,
             default_timeield,
             nested_dir,
             result_queries,
         )
 
-    random.shuffle(result_queries)
-    return result_queries
+    # Round-robin over indexes spreads the load across shards without an RNG pass
+    return [
+        query
+        for group in zip_longest(*queries_by_index)
+        for query in group
+        if query is not None
+    ]
 
 
 def create_directory(temp_dir: str, ind: str, configurator: QueryConfigurator) -> str:
@@ -560,10 +694,8 @@ def handle_index_without_date(
     configurator.log_debug("Index without specific date format, downloading all data.")
     query = configurator.get_query(ind, "").replace("  ", " ")
     if configurator.gte and configurator.lte:
-        hour_condition = HOUR_CONDITION_TEMPLATE["regular"].substitute(
-            default_timeield=default_timeield,
-            start_time_str=configurator.gte,
-            end_time_str=configurator.lte,
+        hour_condition = regular_hour_condition(
+            default_timeield, configurator.gte, configurator.lte
         )
         hour_condition = hour_condition.replace("<", "<=")
         if configurator.name_of_type == "Type":
@@ -576,7 +708,7 @@ def handle_index_without_date(
             .replace("Event.Type='' AND ", "")
             .replace("Type='' AND ", "")
         )
-    temp_filename = os.path.join(nested_dir, f"{ind}_full.pkl")
+    temp_filename = os.path.join(nested_dir, f"{ind}_full.feather")
     result_queries.append([query, temp_filename])
 
 
@@ -599,96 +731,65 @@ def create_queries_for_date_range(
     ind: str,
     start_date: datetime,
     end_date: datetime,
-    is_compressed_index: bool,
     default_timeield: str,
     nested_dir: str,
     result_queries: list,
 ):
-    delta = timedelta(days=1)
-    current_day = start_date
-
-    while current_day < end_date:
-        for hour in range(0, 25, configurator.time_step):
-            start_time = current_day + timedelta(hours=hour)
-            end_time = start_time + timedelta(hours=configurator.time_step)
-
-            start_time_str, end_time_str = get_time_strings(
-                hour, configurator, end_time, start_time
-            )
-
-            if end_time_str == start_time_str:
-                continue
+    start_strings, end_strings = get_time_windows(
+        start_date, end_date, configurator.time_step
+    )
 
-            configurator.log_debug(
-                f"Appending query for {start_time_str}, {end_time_str}..."
-            )
-            append_query(
-                configurator,
-                ind,
-                nested_dir,
-                result_queries,
-                start_time_str,
-                end_time_str,
-                start_date,
-                end_date,
-                default_timeield,
-                is_extra_query=False,
-            )
-            if hour + configurator.time_step > 24:
-                break
+    for start_time_str, end_time_str in zip(start_strings, end_strings):
+        configurator.log_debug(
+            f"Appending query for {start_time_str}, {end_time_str}..."
+        )
+        append_query(
+            configurator,
+            ind,
+            nested_dir,
+            result_queries,
+            start_time_str,
+            end_time_str,
+            start_date,
+            end_date,
+            default_timeield,
+            is_extra_query=False,
+        )
 
-        if not is_compressed_index:
-            append_query(
-                configurator,
-                ind,
-                nested_dir,
-                result_queries,
-                start_time_str,
-                end_time_str,
-                start_date,
-                end_date,
-                default_timeield,
-                is_extra_query=True,
-            )
-        current_day += delta
-        if current_day == end_date and is_compressed_index:
-            append_query(
-                configurator,
-                ind,
-                nested_dir,
-                result_queries,
-                start_time_str,
-                end_time_str,
-                start_date,
-                end_date,
-                default_timeield,
-                is_extra_query=True,
-            )
+    # One extra query per index catches documents outside of its date range
+    append_query(
+        configurator,
+        ind,
+        nested_dir,
+        result_queries,
+        None,
+        None,
+        start_date,
+        end_date,
+        default_timeield,
+        is_extra_query=True,
+    )
 
 
 def intersect_time_ranges(start1: str, end1: str, start2: str, end2: str):
     """
     Returns the intersection of two time ranges and a flag indicating which end time "wins",
     represented as strings, or None and the flag if there is no intersection.
-    """
-    fmt = "%Y-%m-%dT%H:%M:%S.%f"
-    start1_dt, end1_dt = datetime.strptime(start1, fmt), datetime.strptime(end1, fmt)
-    start2_dt, end2_dt = datetime.strptime(start2, fmt), datetime.strptime(end2, fmt)
 
-    max_start = max(start1_dt, start2_dt)
+    All boundaries are expected in the "%Y-%m-%dT%H:%M:%S.fff" format produced by
+    set_gte_lte and get_time_windows. Strings of this fixed-width format sort
+    chronologically, so they are compared as-is without parsing.
+    """
+    max_start = start1 if start1 >= start2 else start2
 
     # Determine the minimum end and corresponding flag
-    if end1_dt < end2_dt:
-        min_end, flag = end1_dt, False
+    if end1 < end2:
+        min_end, flag = end1, False
     else:
-        min_end, flag = end2_dt, True
+        min_end, flag = end2, True
 
     # Return the intersection result and the flag
-    return (
-        ((max_start.strftime(fmt)[:-3], min_end.strftime(fmt)[:-3]), flag)
-        if max_start <= min_end
-        else (None, flag)
-    )
+    return ((max_start, min_end), flag) if max_start <= min_end else (None, flag)
 
 
 def append_query(
@@ -706,50 +807,42 @@ def append_query(
     if is_extra_query:
         temp_filename = os.path.join(
             nested_dir,
-            f"{ind}_extra.pkl",
+            f"{ind}_extra.feather",
         )
         start_time_str = start_date.strftime("%Y-%m-%dT00:00:00.000")
         end_time_str = end_date.strftime("%Y-%m-%dT00:00:00.000")
-        hour_condition = HOUR_CONDITION_TEMPLATE["extra"].substitute(
-            default_timeield=default_timeield,
-            start_time_str=start_time_str,
-            end_time_str=end_time_str,
+        hour_condition = extra_hour_condition(
+            default_timeield, start_time_str, end_time_str
         )
         if configurator.gte and configurator.lte:
-            hour_condition_gte_lte = " " + HOUR_CONDITION_TEMPLATE[
-                "regular"
-            ].substitute(
-                default_timeield=default_timeield,
-                start_time_str=configurator.gte,
-                end_time_str=configurator.lte,
+            hour_condition += " " + regular_hour_condition(
+                default_timeield, configurator.gte, configurator.lte
             )
-            hour_condition += hour_condition_gte_lte
 
     else:
-        start_time_filename = start_time_str.replace(":00:00.000", "")
-        end_time_filename = end_time_str.replace(":00:00.000", "")
-        is_equality = False
+        query_start, query_end, is_equality = start_time_str, end_time_str, False
         if configurator.gte and configurator.lte:
             result = intersect_time_ranges(
                 start_time_str, end_time_str, configurator.gte, configurator.lte
             )
             if not result[0]:
                 return
-            start_time_str = result[0][0]
-            end_time_str = result[0][1]
-            is_equality = result[1]
+            (query_start, query_end), is_equality = result
 
-        temp_filename = os.path.join(
-            nested_dir,
-            f"{ind}_{start_time_filename}_{end_time_filename}.pkl",
-        )
-        hour_condition = HOUR_CONDITION_TEMPLATE["regular"].substitute(
-            default_timeield=default_timeield,
-            start_time_str=start_time_str,
-            end_time_str=end_time_str,
+        result_queries.append(
+            _build_window_entry(
+                configurator,
+                ind,
+                nested_dir,
+                start_time_str,
+                end_time_str,
+                query_start,
+                query_end,
+                is_equality,
+                default_timeield,
+            )
         )
-        if is_equality:
-            hour_condition = hour_condition.replace("<", "<=")
+        return
 
     if configurator.name_of_type == "Type":
         hour_condition = change_time_format(hour_condition)
@@ -758,36 +851,256 @@ def append_query(
     result_queries.append([query, temp_filename])
 
 
-def get_time_strings(hour, configurator, end_time, start_time):
-    start_time_str = start_time.strftime("%Y-%m-%dT%H:00:00.000")
+def _build_window_entry(
+    configurator: QueryConfigurator,
+    ind: str,
+    nested_dir: str,
+    start_time_str: str,
+    end_time_str: str,
+    query_start: str,
+    query_end: str,
+    is_equality: bool,
+    default_timeield: str,
+) -> list[str]:
+    """
+    Builds the `[query, temp_filename]` pair of one time window.
 
-    if hour + configurator.time_step > 24:
-        end_time_str = end_time.strftime("%Y-%m-%dT00:00:00.000")
-    else:
-        end_time_str = end_time.strftime("%Y-%m-%dT%H:00:00.000")
+    The file name comes from the window bounds ("%Y-%m-%dT%H" prefix), the query
+    condition from the (possibly gte/lte-clipped) query bounds.
+    """
+    temp_filename = os.path.join(
+        nested_dir,
+        f"{ind}_{start_time_str[:13]}_{end_time_str[:13]}.feather",
+    )
+    hour_condition = regular_hour_condition(default_timeield, query_start, query_end)
+    if is_equality:
+        hour_condition = hour_condition.replace("<", "<=")
+    if configurator.name_of_type == "Type":
+        hour_condition = change_time_format(hour_condition)
 
-    return start_time_str, end_time_str
+    return [configurator.get_query(ind, hour_condition), temp_filename]
+
+
+def get_time_windows(
+    start_date: datetime, end_date: datetime, time_step: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Builds start/end strings of all query windows between two day boundaries.
+
+    Every day is split into windows of `time_step` hours starting at midnight;
+    the last window of a day is clamped to the next midnight.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Window starts and ends in "%Y-%m-%dT%H:00:00.000" format.
+    """
+    days = pd.date_range(start_date, end_date, freq="D", inclusive="left").to_numpy()
+    offsets = np.arange(0, 24, time_step).astype("timedelta64[h]")
+
+    starts = (days[:, None] + offsets).ravel()
+    day_ends = np.repeat(days + np.timedelta64(1, "D"), len(offsets))
+    ends = np.minimum(starts + np.timedelta64(time_step, "h"), day_ends)
+
+    time_format = "%Y-%m-%dT%H:00:00.000"
+    return (
+        pd.DatetimeIndex(starts).strftime(time_format).to_numpy(),
+        pd.DatetimeIndex(ends).strftime(time_format).to_numpy(),
+    )
 
 
 def prepare_header(fields: str) -> pd.DataFrame:
-    column_names: str = fields.replace("@", "").replace(".", "_").replace("`", "")
+    column_names: str = fields.translate(_FIELD_NAME_TABLE)
     heads: list = [name.strip() for name in column_names.split(",")]
-    df = pd.DataFrame(columns=heads)
+    # Wrap one 2D block so the frame is not built from N single-column blocks
+    df = pd.DataFrame(np.empty((0, len(heads)), dtype=object), columns=heads)
     return df
 
 
+@contextmanager
+def paused_gc():
+    """
+    Disables the cyclic garbage collector for the duration of the block.
+
+    Assembly allocates many short-lived frames without reference cycles, which
+    would otherwise keep triggering automatic collections.
+    The previous collector state is restored on exit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 def write_to_csv(df, output_file, header=False):
     df.to_csv(output_file, index=False, header=header, mode="a", encoding="utf-8")
 
 
+def _is_arrow_convertible(col_data: pd.Series) -> bool:
+    """Checks whether Arrow can store the column as one typed array."""
+    try:
+        pa.array(col_data, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    return True
+
+
+def write_temp_chunk(
+    df: pd.DataFrame, temp_filename: str, configurator: QueryConfigurator
+):
+    """
+    Saves a downloaded chunk as an uncompressed Feather file.
+
+    Feather needs one type per column, so object columns mixing Python types (e.g. a
+    field that is sometimes a number and sometimes a string) are stored as strings,
+    with missing values kept as nulls.
+    """
+    try:
+        df.to_feather(temp_filename, compression="uncompressed")
+        return
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    mixed_columns = [
+        col
+        for col, dtype in df.dtypes.items()
+        if dtype == object and not _is_arrow_convertible(df[col])
+    ]
+    configurator.log_info(
+        f"Columns {mixed_columns} of {temp_filename} mix types, stored as strings"
+    )
+    as_text = {
+        col: df[col].astype(str).where(df[col].notna(), None) for col in mixed_columns
+    }
+    df.assign(**as_text).to_feather(temp_filename, compression="uncompressed")
+
+
+def read_sorted_chunks(
+    temporary_files: list[str],
+    sort_timefield: str,
+    ascending: bool,
+    prefetch: int = 2,
+) -> Iterator[Optional[pd.DataFrame]]:
+    """
+    Yields every temporary file read and sorted by time, in the given order
+    (None for a missing file).
+
+    Up to `prefetch` files are read and sorted ahead in background threads while
+    the caller writes the current one, so at most `prefetch + 1` chunks are in memory.
+    """
+
+    def load(temp_file: str) -> Optional[pd.DataFrame]:
+        if not os.path.exists(temp_file):
+            return None
+        df = pd.read_feather(temp_file)
+        return sort_dataframe_by_time(df, sort_timefield, ascending)
+
+    files = iter(temporary_files)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque(executor.submit(load, f) for f in islice(files, prefetch))
+        while pending:
+            df = pending.popleft().result()
+            next_file = next(files, None)
+            if next_file is not None:
+                pending.append(executor.submit(load, next_file))
+            yield df
+
+
+def write_to_csv_arrow(df, output_file, header=False):
+    """Formats the chunk in Arrow's C++ CSV writer; `output_file` must be binary."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, output_file, pacsv.WriteOptions(include_header=header))
+
+
+def write_to_parquet(
+    temporary_files: list[str],
+    output_file: str,
+    configurator: QueryConfigurator,
+    sort_timefield: str,
+    pbar,
+) -> None:
+    """
+    Streams sorted chunks into one zstd-compressed Parquet file through a single writer.
+
+    The writer schema is the merged schema of all chunks, so a column that is all-null
+    or integer in some chunks still fits the type it has in the others.
+    """
+    existing_files = [f for f in temporary_files if os.path.exists(f)]
+    if not existing_files:
+        heading = prepare_header(configurator.fields)
+        pq.write_table(pa.Table.from_pandas(heading, preserve_index=False), output_file)
+        pbar.update(len(temporary_files))
+        return
+
+    schema = unify_temp_schemas(existing_files)
+    writer = None
+    try:
+        for df in read_sorted_chunks(
+            temporary_files, sort_timefield, configurator.ascending
+        ):
+            if df is not None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    # The time field is parsed while sorting, keep it as a timestamp
+                    schema = pa.schema(
+                        [
+                            table.schema.field(field.name)
+                            if field.name in (sort_timefield, "timestamp")
+                            and field.name in table.column_names
+                            else field
+                            for field in schema
+                        ]
+                    )
+                    writer = pq.ParquetWriter(output_file, schema, compression="zstd")
+                writer.write_table(conform_table(table, schema))
+            pbar.update(1)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Casts a chunk to the given schema, filling columns it lacks with nulls."""
+    columns = [
+        table[field.name].cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(len(table), field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def parse_time_column(df: pd.DataFrame, sort_timefield: str) -> Optional[str]:
+    """
+    Converts the time column of a chunk to datetime64 in place, unless it already is.
+    Returns its name, or None if the chunk has no time column.
+    """
+    if sort_timefield in df.columns:
+        time_column = sort_timefield
+    elif "timestamp" in df.columns:
+        time_column = "timestamp"
+    else:
+        return None
+
+    if not pd.api.types.is_datetime64_any_dtype(df[time_column]):
+        df[time_column] = pd.to_datetime(df[time_column], format="mixed")
+    return time_column
+
+
 def sort_dataframe_by_time(df: pd.DataFrame, sort_timefield: str, ascending=True):
     if not df.empty:
-        if sort_timefield in df.columns:
-            df[sort_timefield] = pd.to_datetime(df[sort_timefield], format="mixed")
-            df = df.sort_values(by=sort_timefield, ascending=ascending)
-        elif "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], format="mixed")
-            df = df.sort_values(by="timestamp", ascending=ascending)
+        time_column = parse_time_column(df, sort_timefield)
+        if time_column is None:
+            return df
+
+        # A check is O(n), skip the sort for chunks that are already in order
+        times = df[time_column]
+        if ascending and times.is_monotonic_increasing:
+            return df
+        if not ascending and times.is_monotonic_decreasing:
+            return df
+        df = df.sort_values(by=time_column, ascending=ascending)
     return df
 
 
@@ -798,10 +1111,33 @@ def aggregate_data_to_variable(
     if len(temporary_files) == 0:
         return pd.DataFrame()
 
-    chunk_dfs = concat_in_chunks(
-        read_dataframes(temporary_files, configurator), chunk_size=10
-    )
-    combined_dataframe = pd.concat(chunk_dfs, ignore_index=True, copy=False)
+    # Arrow concatenation only references the chunk buffers, so unlike
+    # pd.concat it does not hold a second full copy of the data
+    tables = []
+    frames = iter(read_dataframes(temporary_files, configurator))
+    unconverted = []
+    try:
+        for df in frames:
+            unconverted = [df]
+            tables.append(pa.Table.from_pandas(df, preserve_index=False))
+            unconverted = []
+        if len(tables) == 0:
+            return pd.DataFrame()
+        combined_table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # A chunk column Arrow cannot convert, or chunks that disagree on a column
+        # type (e.g. category vs plain strings): pandas resolves both by upcasting
+        # to object. The failed chunk and those not read yet are used as they are
+        converted = [table.to_pandas() for table in tables]
+        combined_dataframe = pd.concat(
+            converted + unconverted + list(frames), ignore_index=True
+        )
+    else:
+        del tables
+        combined_dataframe = combined_table.to_pandas(
+            split_blocks=True, self_destruct=True
+        )
+        del combined_table
     gc.collect()
 
     combined_dataframe = sort_dataframe_by_time(
@@ -817,58 +1153,120 @@ def aggregate_data_to_variable(
 def read_dataframes(
     temporary_files: list[str], configurator: QueryConfigurator
 ) -> Iterator[pd.DataFrame]:
+    existing_files = []
     for temp_filename in temporary_files:
         if os.path.exists(temp_filename):
-            df = pd.read_pickle(temp_filename)
-            if not df.empty:
-                if configurator.compress_df:
-                    df = optimize_dataframe(df)
-                yield df
-                del df
-                gc.collect()
+            existing_files.append(temp_filename)
         else:
             configurator.log_info(f"File {temp_filename} does not exist.")
+    if len(existing_files) == 0:
+        return
 
+    try:
+        schema = unify_temp_schemas(existing_files)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # Chunks with irreconcilable column types are read one by one
+        configurator.log_info("Temporary files have different schemas.")
+        frames = (pd.read_feather(temp_filename) for temp_filename in existing_files)
+    else:
+        # A single dataset scan decodes all files with Arrow's threaded reader
+        dataset = ds.dataset(existing_files, schema=schema, format="feather")
+        frames = (
+            batch.to_pandas(self_destruct=True)
+            for batch in dataset.to_batches(batch_size=65536)
+        )
 
-def concat_in_chunks(
-    df_iter: Iterator[pd.DataFrame], chunk_size: int = 10
-) -> Iterator[pd.DataFrame]:
-    _buffer = []
-    for df in df_iter:
-        _buffer.append(df)
-        if len(_buffer) >= chunk_size:
-            yield pd.concat(_buffer, ignore_index=True, copy=False)
-            _buffer.clear()
-            gc.collect()
-    if _buffer:
-        yield pd.concat(_buffer, ignore_index=True, copy=False)
-        gc.collect()
-
-
-def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    for df in frames:
+        if not df.empty:
+            if configurator.compress_df:
+                df = optimize_dataframe(df, log=configurator.log_debug)
+            yield df
+
+
+def unify_temp_schemas(temporary_files: list[str]) -> pa.Schema:
+    """
+    Reads the schemas of temporary Feather files and merges them into one.
+
+    Columns that are all-null or integer in some chunks are promoted to the
+    type they have in the others.
+    """
+    schemas = []
+    for temp_filename in temporary_files:
+        with pa.memory_map(temp_filename) as source:
+            schemas.append(pa.ipc.open_file(source).schema)
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def _downcast_one(item: tuple[str, pd.Series], log=None) -> tuple[str, Any]:
+    """
+    Picks a smaller dtype for one column. Returns `(name, None)` if nothing changes.
+    `log`, if given, receives the reason a column could not be converted.
+    """
+    col, col_data = item
+    try:
+        if pd.api.types.is_integer_dtype(col_data):
+            downcasted = pd.to_numeric(col_data, downcast="integer")
+            if downcasted.dtype != col_data.dtype:
+                return col, downcasted
+
+        elif pd.api.types.is_float_dtype(col_data):
+            values = col_data.to_numpy()
+            # Skip the float16 cast when a finite value is past its range
+            abs_values = np.abs(values)
+            abs_values[~np.isfinite(abs_values)] = 0
+            max_abs = abs_values.max() if abs_values.size else 0.0
+            candidates = ["float32"]
+            if max_abs <= np.finfo(np.float16).max:
+                candidates.insert(0, "float16")
+
+            for dtype in candidates:
+                downcasted = values.astype(dtype)
+                if np.allclose(
+                    values, downcasted, rtol=1e-3, atol=1e-3, equal_nan=True
+                ):
+                    return col, downcasted
+
+        elif pd.api.types.is_object_dtype(col_data):
+            # One hashing pass gives both the cardinality and the codes
+            try:
+                codes, categories = pd.factorize(col_data, sort=True)
+            except TypeError:
+                # Values that cannot be ordered together keep first-seen order;
+                # unhashable values (dicts, lists) raise again and stay object
+                codes, categories = pd.factorize(col_data, sort=False)
+            num_unique = len(categories) + int((codes == -1).any())
+            total = len(col_data)
+            if num_unique / total < 0.5:
+                return col, pd.Categorical.from_codes(codes, categories)
+            # High-cardinality text: Arrow offsets + bytes instead of a PyObject per cell
+            if pd.api.types.infer_dtype(col_data, skipna=True) == "string":
+                return col, col_data.astype("string[pyarrow]")
+    except Exception as e:
+        if log is not None:
+            log(f"Column {col} keeps dtype {col_data.dtype}: {type(e).__name__}: {e}")
+
+    return col, None
+
+
+@lru_cache(maxsize=1)
+def _downcast_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Column pool shared by every optimize_dataframe call, created on first use."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="downcast"
+    )
+
+
+def optimize_dataframe(df: pd.DataFrame, log=None) -> pd.DataFrame:
     """Compresses the DataFrame by downcasting data types to save memory."""
-    for col in df.columns:
-        try:
-            col_data = df[col]
-            if pd.api.types.is_integer_dtype(col_data):
-                df[col] = pd.to_numeric(col_data, downcast="integer")
-
-            elif pd.api.types.is_float_dtype(col_data):
-                for dtype in ["float16", "float32"]:
-                    downcasted = col_data.astype(dtype)
-                    if np.allclose(
-                        col_data, downcasted, rtol=1e-3, atol=1e-3, equal_nan=True
-                    ):
-                        df[col] = downcasted
-                        break
+    # numpy/pandas release the GIL in astype/allclose, so columns are cast in
+    # parallel. Callers run on the main thread after the download pool has shut
+    # down, and one shared pool serves every chunk instead of a pool per call
+    results = _downcast_executor().map(partial(_downcast_one, log=log), df.items())
 
-            elif pd.api.types.is_object_dtype(col_data):
-                num_unique = col_data.nunique(dropna=False)
-                total = len(col_data)
-                if num_unique / total < 0.5:
-                    df[col] = col_data.astype("category")
-        except:
-            pass
+    # One bulk assign instead of per-column setitem keeps the block manager compact
+    changed = {col: data for col, data in results if data is not None}
+    if changed:
+        df = df.assign(**changed)
 
     return df
 
@@ -901,27 +1299,17 @@ def download_data_parallel(
         else DummyTqdm
     )
 
-    peak_memory_usage = [0]
-    if not configurator.isin_container:
-
-        def memory_monitor_loop():
-            process = psutil.Process(os.getpid())
-            while not stop_monitoring.is_set():
-                mem = process.memory_info().rss / (1024**2)  # в мегабайтах
-                if mem > peak_memory_usage[0]:
-                    peak_memory_usage[0] = mem
-                sleep(0.5)
-
-        stop_monitoring = threading.Event()
-        memory_thread = threading.Thread(target=memory_monitor_loop)
-        memory_thread.start()
-
     start_exec_time = datetime.now()
 
     queries_to_download = prepare_queries(
         configurator, temp_dir, self.default_timefield
     )
 
+    # Shared by all workers, so the field string is cleaned only once
+    df_columns = configurator.fields.translate(_FIELD_NAME_TABLE).split(", ")
+    heading = prepare_header(configurator.fields)
+    sort_timefield = self.default_timefield.replace(".", "_")
+
     def _process_single_query(single_query: list[str], pbar):
         nonlocal success_count, error_count
         query = single_query[0]
@@ -940,13 +1328,15 @@ def download_data_parallel(
                 data = self.get_dataframe(
                     query,
                     cursor=True,
-                    df_columns=configurator.fields.replace("@", "")
-                    .replace(".", "_")
-                    .replace("`", "")
-                    .split(", "),
+                    df_columns=df_columns,
                 )
                 if not data.empty:
-                    data.to_pickle(temp_filename)
+                    # Stored as datetime64, so assembly sorts int64 instead of parsing
+                    try:
+                        parse_time_column(data, sort_timefield)
+                    except (ValueError, TypeError):
+                        pass
+                    write_temp_chunk(data, temp_filename, configurator)
                 else:
                     configurator.log_info(f"{query} result is empty.")
                     temp_filename = None
@@ -956,21 +1346,21 @@ def download_data_parallel(
         except Exception as e:
             if not configurator.ignore_exceptions:
                 configurator.log_error(f'"{query}" --- ERROR: {e}', console=True)
+                # os._exit skips finalizers, so the queued records are written first
+                configurator.close()
                 os._exit(1)
             configurator.log_error(f'\n"{query}" --- ERROR: {e}')
             with counter_lock:
                 error_count += 1
 
         pbar.update(1)
-        gc.collect()
         return temp_filename
 
     def finalize_process():
         configurator.log_info("Starting finalize_process.")
+        peak_memory_usage = 0
         if not configurator.isin_container:
-            stop_monitoring.set()
-            memory_thread.join()
-            configurator.log_info("Joined Memory Thread")
+            peak_memory_usage = get_peak_memory_usage()
 
         summary(
             configurator,
@@ -983,11 +1373,16 @@ def download_data_parallel(
         configurator.log_info("Summary is sent")
 
         if configurator.temp_files:
+            # The file may be copied to another filesystem, so it must be complete
+            configurator.flush_log()
             move_query_log_file(configurator, temp_dir)
 
         if not configurator.temp_files and not is_old_cache:
             delete_directory(configurator, temp_dir)
 
+        # Everything logged by the run is in the file once it returns
+        configurator.flush_log()
+
     try:
         num_threads = min(num_threads, len(queries_to_download))
         configurator.log_info(
@@ -1003,20 +1398,29 @@ def download_data_parallel(
             bar_format="{l_bar}{bar:40}| \033[92m{n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]\033[0m",
         ) as pbar:
             process_with_pbar = partial(_process_single_query, pbar=pbar)
+            # At most 2x threads queries are queued, results are taken as they finish
+            in_flight = threading.Semaphore(num_threads * 2)
+            futures = []
             with concurrent.futures.ThreadPoolExecutor(
                 max_workers=num_threads
             ) as executor:
+                for single_query in queries_to_download:
+                    in_flight.acquire()
+                    future = executor.submit(process_with_pbar, single_query)
+                    future.add_done_callback(lambda _: in_flight.release())
+                    futures.append(future)
+
+                results = (
+                    future.result()
+                    for future in concurrent.futures.as_completed(futures)
+                )
                 all_temp_files = [
-                    result
-                    for result in executor.map(process_with_pbar, queries_to_download)
-                    if result is not None
+                    temp_file for temp_file in results if temp_file is not None
                 ]
 
         configurator.log_info("Parallel downloading finished.", console=True)
         temporary_files = sorted(all_temp_files, reverse=not configurator.ascending)
-        gc.collect()
 
-        sort_timefield = self.default_timefield.replace(".", "_")
         if configurator.return_df:
             result = aggregate_data_to_variable(
                 temporary_files, configurator, sort_timefield
@@ -1027,7 +1431,7 @@ def download_data_parallel(
         configurator.log_info(f"Starting assembly result file {output_file}")
         file_extension = os.path.splitext(output_file)[1]
 
-        with Tqdm(
+        with paused_gc(), Tqdm(
             total=len(queries_to_download),
             desc=f"Assembling {configurator.event_type}",
             unit="query",
@@ -1035,29 +1439,35 @@ def download_data_parallel(
             ascii=True,
             bar_format="{l_bar}{bar:40}| \033[92m{n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]\033[0m",
         ) as pbar1:
-            if file_extension == ".csv":
-                mode = "w"
-                newline = ""
-                write_function = write_to_csv
-                encoding = "utf-8"
+            if file_extension == ".parquet":
+                write_to_parquet(
+                    temporary_files, output_file, configurator, sort_timefield, pbar1
+                )
+            elif file_extension == ".csv":
+                if configurator.arrow_csv:
+                    mode = "wb"
+                    newline = None
+                    write_function = write_to_csv_arrow
+                    encoding = None
+                else:
+                    mode = "w"
+                    newline = ""
+                    write_function = write_to_csv
+                    encoding = "utf-8"
+
+                with open(
+                    output_file, mode=mode, newline=newline, encoding=encoding
+                ) as f_out:
+                    write_function(heading, f_out, header=True)
+                    for df in read_sorted_chunks(
+                        temporary_files, sort_timefield, configurator.ascending
+                    ):
+                        if df is not None:
+                            write_function(df, f_out)
+                        pbar1.update(1)
             else:
                 raise ValueError("Unsupported file extension")
 
-            heading = prepare_header(configurator.fields)
-            with open(
-                output_file, mode=mode, newline=newline, encoding=encoding
-            ) as f_out:
-                write_function(heading, f_out, header=True)
-                for temp_file in temporary_files:
-                    if os.path.exists(temp_file):
-                        df = pd.read_pickle(temp_file)
-                        df = sort_dataframe_by_time(
-                            df, sort_timefield, configurator.ascending
-                        )
-                        write_function(df, f_out)
-                    pbar1.update(1)
-                    gc.collect()
-
     except Exception as e:
         error_type = type(e).__name__
         tb = traceback.format_exc()
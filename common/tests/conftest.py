@@ -0,0 +1,9 @@
+"""
+The downloader is imported as a top-level module, as when it is run from its
+directory, so that directory goes on sys.path
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
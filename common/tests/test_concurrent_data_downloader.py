@@ -0,0 +1,67 @@
+"""
+Tests for the temporary chunk files of the downloader
+"""
+
+import pandas as pd
+import pytest
+
+# The downloader logs through the company logging library
+pytest.importorskip("logger_lib")
+
+import concurrent_data_downloader as downloader
+
+
+class _Configurator:
+    """Collects the log records of the code under test"""
+
+    def __init__(self):
+        self.messages = []
+
+    def log_info(self, message, console=False):
+        self.messages.append(message)
+
+    log_debug = log_info
+
+
+def test_write_temp_chunk_stores_mixed_type_columns_as_strings(tmp_path):
+    chunk = pd.DataFrame(
+        {"value": [1, "x", None, 2.5], "count": [1, 2, 3, 4], "name": list("abcd")}
+    )
+    temp_filename = str(tmp_path / "chunk.feather")
+    configurator = _Configurator()
+
+    downloader.write_temp_chunk(chunk, temp_filename, configurator)
+
+    stored = pd.read_feather(temp_filename)
+    assert stored["value"].tolist() == ["1", "x", None, "2.5"]
+    assert stored["count"].tolist() == [1, 2, 3, 4]
+    assert stored["name"].tolist() == list("abcd")
+    assert any("value" in message for message in configurator.messages)
+
+
+def test_write_temp_chunk_keeps_uniform_columns(tmp_path):
+    chunk = pd.DataFrame({"count": [1, 2], "name": ["a", None]})
+    temp_filename = str(tmp_path / "chunk.feather")
+
+    downloader.write_temp_chunk(chunk, temp_filename, _Configurator())
+
+    pd.testing.assert_frame_equal(pd.read_feather(temp_filename), chunk)
+
+
+def test_aggregate_falls_back_to_pandas_for_unconvertible_chunk(monkeypatch):
+    times = [f"2024-01-01T00:0{minute}:00" for minute in range(5)]
+    chunks = [
+        pd.DataFrame({"time": times[:2], "value": [1, 2]}),
+        pd.DataFrame({"time": times[2:4], "value": [5, "x"]}),
+        pd.DataFrame({"time": times[4:], "value": [7]}),
+    ]
+    monkeypatch.setattr(
+        downloader, "read_dataframes", lambda files, configurator: iter(chunks)
+    )
+    configurator = _Configurator()
+    configurator.ascending = True
+
+    result = downloader.aggregate_data_to_variable(["chunk"], configurator, "time")
+
+    assert result["time"].tolist() == list(pd.to_datetime(times))
+    assert result["value"].tolist() == [1, 2, 5, "x", 7]
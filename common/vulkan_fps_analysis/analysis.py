@@ -4,39 +4,98 @@ Analysis logic for the effect of Vulkan implementation on player FPS
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 from scipy import stats
-from typing import Tuple, Dict, Set
+from typing import Tuple, Dict
 
 import config
 
+# Row filters below return frames that are never modified in place; with
+# Copy-on-Write (always on since pandas 3.0) they need no defensive copy
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
 
-def load_data(filepath: str) -> pd.DataFrame:
-    """Loads data from CSV file"""
-    return pd.read_csv(filepath)
+STATUS_TEXT = np.array(["worsened", "unchanged", "improved"], dtype=object)
+
+
+def _overall_status(metric_statuses: Tuple[int, ...]) -> int:
+    """
+    Overall status code (index into STATUS_TEXT) for one set of metric statuses:
+    - if 2/3 metrics improved = result - improvement
+    - if 3/3 metrics unchanged = result - unchanged
+    - if 1/3 improved, 2/3 unchanged = result - improvement
+    - otherwise worsened
+    """
+    improvements = metric_statuses.count(1)
+    unchanged = metric_statuses.count(0)
+    if improvements >= 2 or (improvements == 1 and unchanged == 2):
+        return 2
+    if unchanged == 3:
+        return 1
+    return 0
+
+
+# Overall status of every avg/min/1pct combination, indexed by its base-3 code
+OVERALL_STATUS_BY_CODE = np.array(
+    [_overall_status(statuses) for statuses in product((-1, 0, 1), repeat=3)],
+    dtype=np.int8,
+)
+
+# Worsened/unchanged/improved counts of every combination, same indexing
+STATUS_COUNTS_BY_CODE = np.array(
+    [
+        [statuses.count(-1), statuses.count(0), statuses.count(1)]
+        for statuses in product((-1, 0, 1), repeat=3)
+    ],
+    dtype=np.int64,
+)
+
+
+def load_data(filepath: str, **read_csv_kwargs) -> pd.DataFrame:
+    """Loads data from CSV file with the multi-threaded pyarrow parser"""
+    return pd.read_csv(
+        filepath, engine="pyarrow", dtype_backend="pyarrow", **read_csv_kwargs
+    )
 
 
 def load_and_merge_data(
     offer_fps_filepath: str, client_info_filepath: str
 ) -> pd.DataFrame:
     """Loads and merges offer_fps and client_info data by SessionId"""
-    # Load data
-    offer_fps_df = pd.read_csv(offer_fps_filepath)
-    client_info_df = pd.read_csv(client_info_filepath)
+    # Load data; repeated device names become categories (int codes for groupby).
+    # The mission id is a NumPy float, as the default parser reads a column with
+    # empty cells, so mission filters are plain bool masks where NaN is False
+    offer_fps_df = load_data(
+        offer_fps_filepath,
+        dtype={
+            "s_MissionId": "float64",
+            "DeviceModel": "category",
+            "c_GraphicsDeviceName": "category",
+        },
+    )
+    client_info_df = load_data(
+        client_info_filepath,
+        usecols=["SessionId", "c_GraphicsDeviceType"],
+        dtype={"c_GraphicsDeviceType": "category"},
+    )
 
     # Merge by SessionId, adding c_GraphicsDeviceType field
-    merged_df = offer_fps_df.merge(
-        client_info_df[["SessionId", "c_GraphicsDeviceType"]],
-        on="SessionId",
-        how="left",
-    )
+    merged_df = offer_fps_df.merge(client_info_df, on="SessionId", how="left")
+
+    # FPS metrics go through NumPy and SciPy, which want plain NaN-aware floats
+    merged_df[config.FPS_METRICS] = merged_df[config.FPS_METRICS].astype("float64")
+
+    # Repeated ids hash once per category instead of once per row
+    merged_df["AccountId"] = merged_df["AccountId"].astype("category")
 
     return merged_df
 
 
 def split_by_mission(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Splits data into before and after Vulkan"""
-    df_before = df[df["s_MissionId"] == config.MISSION_BEFORE].copy()
-    df_after = df[df["s_MissionId"] == config.MISSION_AFTER].copy()
+    df_before = df[df["s_MissionId"] == config.MISSION_BEFORE]
+    df_after = df[df["s_MissionId"] == config.MISSION_AFTER]
     return df_before, df_after
 
 
@@ -51,17 +110,19 @@ def validate_vulkan_pairs(
         invalid_pairs: invalid pairs for reporting
     """
     # Find players with Vulkan on mission 967
-    vulkan_players = set(
-        df_after[df_after["c_GraphicsDeviceType"] == "Vulkan"]["AccountId"].unique()
+    vulkan_players = pd.Index(
+        df_after.loc[
+            df_after["c_GraphicsDeviceType"].eq("Vulkan"), "AccountId"
+        ].unique()
     )
 
     # Find players who are in both missions
-    accounts_before = set(df_before["AccountId"].unique())
-    accounts_after = set(df_after["AccountId"].unique())
-    accounts_both = accounts_before & accounts_after
+    accounts_before = pd.Index(df_before["AccountId"].unique())
+    accounts_after = pd.Index(df_after["AccountId"].unique())
+    accounts_both = accounts_before.intersection(accounts_after)
 
     # Find invalid pairs (players who are in both missions but don't have Vulkan on 967)
-    invalid_accounts = accounts_both - vulkan_players
+    invalid_accounts = accounts_both.difference(vulkan_players)
 
     # Create DataFrame with invalid pairs (grouped by device and GPU)
     invalid_pairs = df_after[df_after["AccountId"].isin(invalid_accounts)][
@@ -69,170 +130,121 @@ def validate_vulkan_pairs(
     ].drop_duplicates()
 
     # Filter data only for valid players (exclude invalid pairs)
-    valid_before = df_before[df_before["AccountId"].isin(vulkan_players)].copy()
-    valid_after = df_after[df_after["AccountId"].isin(vulkan_players)].copy()
+    valid_before = df_before[df_before["AccountId"].isin(vulkan_players)]
+    valid_after = df_after[df_after["AccountId"].isin(vulkan_players)]
 
     return valid_before, valid_after, invalid_pairs
 
 
 def find_matched_accounts(
     df_before: pd.DataFrame, df_after: pd.DataFrame
-) -> Tuple[Set, Set, Set]:
+) -> Tuple[pd.Index, pd.Index, pd.Index]:
     """Finds players who took the test before and after"""
-    accounts_before = set(df_before["AccountId"].unique())
-    accounts_after = set(df_after["AccountId"].unique())
-    accounts_both = accounts_before & accounts_after
+    accounts_before = pd.Index(df_before["AccountId"].unique())
+    accounts_after = pd.Index(df_after["AccountId"].unique())
+    accounts_both = accounts_before.intersection(accounts_after)
     return accounts_before, accounts_after, accounts_both
 
 
 def filter_matched_players(
-    df_before: pd.DataFrame, df_after: pd.DataFrame, accounts_both: Set
+    df_before: pd.DataFrame, df_after: pd.DataFrame, accounts_both: pd.Index
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Filters data only for players who took both tests"""
-    df_before_matched = df_before[df_before["AccountId"].isin(accounts_both)].copy()
-    df_after_matched = df_after[df_after["AccountId"].isin(accounts_both)].copy()
+    df_before_matched = df_before[df_before["AccountId"].isin(accounts_both)]
+    df_after_matched = df_after[df_after["AccountId"].isin(accounts_both)]
     return df_before_matched, df_after_matched
 
 
-def aggregate_player_data(df_subset: pd.DataFrame) -> pd.DataFrame:
-    """Aggregates data by player (median value)"""
-    agg_dict = {
-        "c_FpsAvg": "median",
-        "c_FpsAvgMax": "median",
-        "c_FpsAvgMin": "median",
-        "c_FpsAvgOnePercentile": "median",
-        "c_FpsAvgZeroOnePercentile": "median",
-        "DeviceModel": "first",
-        "c_GraphicsDeviceName": "first",
-    }
-    return df_subset.groupby("AccountId").agg(agg_dict).reset_index()
+def aggregate_player_data(
+    df_before: pd.DataFrame, df_after: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Aggregates data by player (median value) for both periods in one groupby
+    and lays them out side by side as `<column>_before` / `<column>_after`.
+    Only players present in both periods are kept.
+    """
+    combined = pd.concat(
+        [df_before.assign(period="before"), df_after.assign(period="after")],
+        ignore_index=True,
+    )
+    grouper = combined.groupby(["AccountId", "period"], sort=False, observed=True)
+    first_columns = ["DeviceModel", "c_GraphicsDeviceName"]
+
+    # Numeric medians and "first" of text columns take separate fast paths
+    aggregated = pd.concat(
+        [
+            grouper[config.FPS_METRICS].median(),
+            grouper[first_columns].first(),
+        ],
+        axis=1,
+    )
+    players = aggregated.unstack("period")
 
+    # Same players as an inner merge of the two periods
+    in_both = grouper.size().unstack("period").notna().all(axis=1)
+    players = players[in_both].sort_index()
 
-def merge_before_after(
-    players_before: pd.DataFrame, players_after: pd.DataFrame
-) -> pd.DataFrame:
-    """Merges before and after data with column renaming"""
-    players_before.columns = ["AccountId"] + [
-        f"{col}_before" for col in players_before.columns[1:]
+    columns = config.FPS_METRICS + first_columns
+    players = players[
+        [(col, period) for period in ("before", "after") for col in columns]
     ]
-    players_after.columns = ["AccountId"] + [
-        f"{col}_after" for col in players_after.columns[1:]
-    ]
-    return players_before.merge(players_after, on="AccountId")
+    players.columns = [f"{col}_{period}" for col, period in players.columns]
+    return players.reset_index()
 
 
 def calculate_deltas(players_comparison: pd.DataFrame) -> pd.DataFrame:
     """Calculates absolute and percentage FPS changes"""
-    for metric in config.FPS_METRICS:
-        # Absolute change
-        players_comparison[f"{metric}_delta"] = (
-            players_comparison[f"{metric}_after"]
-            - players_comparison[f"{metric}_before"]
-        )
+    metrics = config.FPS_METRICS
+    before = players_comparison[[f"{m}_before" for m in metrics]].to_numpy(float)
+    after = players_comparison[[f"{m}_after" for m in metrics]].to_numpy(float)
 
-        # Percentage change
-        players_comparison[f"{metric}_pct_change"] = (
-            players_comparison[f"{metric}_delta"]
-            / players_comparison[f"{metric}_before"].replace(0, np.nan)
-        ) * 100
+    # Absolute and percentage change for all metrics in one pass over the block
+    delta = after - before
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_change = np.where(before != 0, delta / before * 100, np.nan)
 
-    return players_comparison
+    changes = {}
+    for i, metric in enumerate(metrics):
+        changes[f"{metric}_delta"] = delta[:, i]
+        changes[f"{metric}_pct_change"] = pct_change[:, i]
+
+    return players_comparison.assign(**changes)
 
 
 def calculate_improvement_flags(players_comparison: pd.DataFrame) -> pd.DataFrame:
     """Determines improvement flags for key metrics"""
     # Determine status for each metric: 1 = improved, 0 = unchanged, -1 = worsened
-    players_comparison["fps_avg_status"] = players_comparison[
-        f"{config.KEY_METRICS['avg']}_delta"
-    ].apply(
-        lambda x: (
-            1
-            if x > config.MINIMUM_CHANGE_THRESHOLD
-            else (0 if abs(x) <= config.MINIMUM_CHANGE_THRESHOLD else -1)
-        )
-    )
-    players_comparison["fps_min_status"] = players_comparison[
-        f"{config.KEY_METRICS['min']}_delta"
-    ].apply(
-        lambda x: (
-            1
-            if x > config.MINIMUM_CHANGE_THRESHOLD
-            else (0 if abs(x) <= config.MINIMUM_CHANGE_THRESHOLD else -1)
-        )
-    )
-    players_comparison["fps_1pct_status"] = players_comparison[
-        f"{config.KEY_METRICS['percentile_1']}_delta"
-    ].apply(
-        lambda x: (
-            1
-            if x > config.MINIMUM_CHANGE_THRESHOLD
-            else (0 if abs(x) <= config.MINIMUM_CHANGE_THRESHOLD else -1)
+    status_columns = {
+        "fps_avg_status": config.KEY_METRICS["avg"],
+        "fps_min_status": config.KEY_METRICS["min"],
+        "fps_1pct_status": config.KEY_METRICS["percentile_1"],
+    }
+    threshold = config.MINIMUM_CHANGE_THRESHOLD
+    for status_column, metric in status_columns.items():
+        delta = players_comparison[f"{metric}_delta"].to_numpy()
+        # Anything not above the threshold is unchanged if it is not below
+        # -threshold, so no abs() temporary is needed; NaN deltas fail both
+        # comparisons and end up as worsened
+        players_comparison[status_column] = np.where(
+            delta > threshold, 1, np.where(delta >= -threshold, 0, -1)
         )
-    )
-
-    # Count improvements, worsenings and unchanged
-    players_comparison["improvements_count"] = (
-        (players_comparison["fps_avg_status"] == 1).astype(int)
-        + (players_comparison["fps_min_status"] == 1).astype(int)
-        + (players_comparison["fps_1pct_status"] == 1).astype(int)
-    )
-    players_comparison["worsenings_count"] = (
-        (players_comparison["fps_avg_status"] == -1).astype(int)
-        + (players_comparison["fps_min_status"] == -1).astype(int)
-        + (players_comparison["fps_1pct_status"] == -1).astype(int)
-    )
-    players_comparison["unchanged_count"] = (
-        (players_comparison["fps_avg_status"] == 0).astype(int)
-        + (players_comparison["fps_min_status"] == 0).astype(int)
-        + (players_comparison["fps_1pct_status"] == 0).astype(int)
-    )
-
-    # New evaluation logic:
-    # - if 2/3 metrics improved = result - improvement
-    # - if 3/3 metrics unchanged = result - unchanged
-    # - if 1/3 improved, 2/3 unchanged = result - improvement
-    # - otherwise worsened
-    def determine_overall_status(row):
-        improvements = row["improvements_count"]
-        unchanged = row["unchanged_count"]
-
-        # If 2+ metrics improved = improvement
-        if improvements >= 2:
-            return "improved"
-
-        # If all 3 metrics unchanged = unchanged
-        if unchanged == 3:
-            return "unchanged"
 
-        # If 1 improved and 2 unchanged = improvement
-        if improvements == 1 and unchanged == 2:
-            return "improved"
+    # Counts and overall status are table lookups by the base-3 code of the statuses
+    statuses = players_comparison[list(status_columns)].to_numpy()
+    codes = (statuses + 1) @ np.array([9, 3, 1])
 
-        # In all other cases = worsening
-        return "worsened"
+    # Count improvements, worsenings and unchanged
+    counts = STATUS_COUNTS_BY_CODE[codes]
+    players_comparison["improvements_count"] = counts[:, 2]
+    players_comparison["worsenings_count"] = counts[:, 0]
+    players_comparison["unchanged_count"] = counts[:, 1]
 
-    players_comparison["overall_status"] = players_comparison.apply(
-        determine_overall_status, axis=1
-    )
+    players_comparison["overall_status"] = STATUS_TEXT[OVERALL_STATUS_BY_CODE[codes]]
 
     # Convert numeric statuses to text for backward compatibility
-    def status_to_text(status):
-        if status == 1:
-            return "improved"
-        elif status == 0:
-            return "unchanged"
-        else:  # status == -1
-            return "worsened"
-
-    players_comparison["fps_avg_improved"] = players_comparison["fps_avg_status"].apply(
-        status_to_text
-    )
-    players_comparison["fps_min_improved"] = players_comparison["fps_min_status"].apply(
-        status_to_text
-    )
-    players_comparison["fps_1pct_improved"] = players_comparison[
-        "fps_1pct_status"
-    ].apply(status_to_text)
+    players_comparison["fps_avg_improved"] = STATUS_TEXT[statuses[:, 0] + 1]
+    players_comparison["fps_min_improved"] = STATUS_TEXT[statuses[:, 1] + 1]
+    players_comparison["fps_1pct_improved"] = STATUS_TEXT[statuses[:, 2] + 1]
     players_comparison["overall_improved"] = players_comparison["overall_status"]
 
     return players_comparison
@@ -287,12 +299,17 @@ def perform_statistical_tests(players_comparison: pd.DataFrame) -> Dict:
     """Performs paired t-tests for key metrics"""
     test_results = {}
 
-    for metric_key, metric_name in config.KEY_METRICS.items():
-        before_values = players_comparison[f"{metric_name}_before"]
-        after_values = players_comparison[f"{metric_name}_after"]
-
-        t_stat, p_value = stats.ttest_rel(after_values, before_values)
+    # One ttest_rel call over a (players x metrics) block tests every metric at once
+    metric_names = list(config.KEY_METRICS.values())
+    before_values = players_comparison[[f"{m}_before" for m in metric_names]]
+    after_values = players_comparison[[f"{m}_after" for m in metric_names]]
+    t_stats, p_values = stats.ttest_rel(
+        after_values.to_numpy(float), before_values.to_numpy(float), axis=0
+    )
 
+    for (metric_key, metric_name), t_stat, p_value in zip(
+        config.KEY_METRICS.items(), t_stats, p_values
+    ):
         test_results[metric_key] = {
             "metric_name": metric_name,
             "t_statistic": t_stat,
@@ -308,8 +325,11 @@ def _aggregate_analysis_data(
     players_comparison: pd.DataFrame, group_by
 ) -> pd.DataFrame:
     """Common function for aggregating analysis data"""
+    # Improvement rate is the mean of a 0/1 column, so no per-group Python lambda
+    is_improved = players_comparison["overall_status"].eq("improved").astype(np.int8)
     analysis = (
-        players_comparison.groupby(group_by)
+        players_comparison.assign(is_improved=is_improved)
+        .groupby(group_by, observed=True)
         .agg(
             {
                 "AccountId": "count",
@@ -322,13 +342,13 @@ def _aggregate_analysis_data(
                 "c_FpsAvg_delta": "mean",
                 "c_FpsAvgMin_delta": "mean",
                 "c_FpsAvgOnePercentile_delta": "mean",
-                "overall_status": lambda x: (x == "improved").mean(),
+                "is_improved": "mean",
             }
         )
         .rename(
             columns={
                 "AccountId": "player_count",
-                "overall_status": "improvement_rate",
+                "is_improved": "improvement_rate",
             }
         )
     )
@@ -383,12 +403,12 @@ def get_dataset_stats(
 
 
 def get_account_stats(
-    accounts_before: Set,
-    accounts_after: Set,
-    accounts_both: Set,
-    accounts_before_valid: Set,
-    accounts_after_valid: Set,
-    accounts_both_valid: Set,
+    accounts_before: pd.Index,
+    accounts_after: pd.Index,
+    accounts_both: pd.Index,
+    accounts_before_valid: pd.Index,
+    accounts_after_valid: pd.Index,
+    accounts_both_valid: pd.Index,
 ) -> Dict:
     """Gets player statistics"""
     return {
@@ -432,12 +452,8 @@ def prepare_analysis_data(
         df_before_valid, df_after_valid, accounts_both
     )
 
-    # Aggregate by players
-    players_before = aggregate_player_data(df_before_matched)
-    players_after = aggregate_player_data(df_after_matched)
-
-    # Merge data
-    players_comparison = merge_before_after(players_before, players_after)
+    # Aggregate by players and put before/after side by side
+    players_comparison = aggregate_player_data(df_before_matched, df_after_matched)
 
     # Calculate changes
     players_comparison = calculate_deltas(players_comparison)
@@ -452,8 +468,8 @@ def prepare_analysis_data(
             accounts_before,
             accounts_after,
             accounts_both,
-            set(df_before_valid["AccountId"].unique()),
-            set(df_after_valid["AccountId"].unique()),
+            accounts_before,
+            accounts_after,
             accounts_both,
         ),
         "matched_records_before": len(df_before_matched),
@@ -483,8 +499,15 @@ def perform_full_analysis(
     # Statistical tests
     results["statistical_tests"] = perform_statistical_tests(players_comparison)
 
+    # Device and GPU groupbys are independent and release the GIL in their
+    # numeric reductions, so they run side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        device_future = executor.submit(analyze_by_device, players_comparison)
+        gpu_future = executor.submit(analyze_by_gpu, players_comparison)
+        device_analysis = device_future.result()
+        gpu_analysis = gpu_future.result()
+
     # Analysis by devices
-    device_analysis = analyze_by_device(players_comparison)
     device_analysis_filtered = filter_by_min_players(device_analysis)
     devices_improved, devices_worsened = classify_improved_worsened(
         device_analysis_filtered
@@ -498,7 +521,6 @@ def perform_full_analysis(
     }
 
     # Analysis by GPU
-    gpu_analysis = analyze_by_gpu(players_comparison)
     gpu_analysis_filtered = filter_by_min_players(gpu_analysis)
     gpu_improved, gpu_worsened = classify_improved_worsened(gpu_analysis_filtered)
 
@@ -9,6 +9,18 @@ OUTPUT_REPORT = "vulkan_analysis_report.md"
 OUTPUT_PLAYERS_CSV = "players_comparison_detailed.csv"
 OUTPUT_DEVICES_CSV = "devices_analysis.csv"
 OUTPUT_GPU_CSV = "gpu_analysis.csv"
+# CSV outputs of at least this many bytes are written gzip-compressed as
+# "<name>.csv.gz" (None always writes plain CSV)
+CSV_GZIP_MIN_BYTES = 1 << 20
+# Write the CSVs with pyarrow's writer (faster; quotes all strings, lowercase booleans)
+ARROW_CSV = False
+# Parquet siblings of the CSV outputs (None disables one)
+OUTPUT_PLAYERS_PARQUET = "players_comparison_detailed.parquet"
+OUTPUT_DEVICES_PARQUET = "devices_analysis.parquet"
+OUTPUT_GPU_PARQUET = "gpu_analysis.parquet"
+# Directory of uncompressed Arrow IPC copies of the three tables
+# (players/devices/gpu.arrow) for zero-copy reads (None disables)
+OUTPUT_ARROW_DIR = "arrow_tables"
 PLOTS_DIR = "plots"
 
 # Mission parameters
@@ -46,6 +58,7 @@ PLOT_STYLE = "seaborn-v0_8-darkgrid"
 PLOT_PALETTE = "husl"
 DEFAULT_FIGSIZE = (12, 6)
 DEFAULT_FONTSIZE = 10
+SCATTER_BACKEND = "matplotlib"  # "datashader" rasterizes large scatter plots
 
 # Colors for visualizations
 COLOR_IMPROVED = "#2ecc71"
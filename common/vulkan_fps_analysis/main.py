@@ -26,14 +26,8 @@ def main():
     # Step 3: Generate visualizations
     report_generator.generate_all_plots(players_comparison, analysis_results)
 
-    # Step 4: Generate report
-    report_content = report_generator.generate_markdown_report(
-        players_comparison, metadata, analysis_results
-    )
-    report_generator.save_report(report_content, config.OUTPUT_REPORT)
-
-    # Step 5: Save CSV files
-    report_generator.save_csv_outputs(players_comparison, analysis_results)
+    # Step 4: Generate report and save CSV files (written concurrently)
+    report_generator.save_all_outputs(players_comparison, metadata, analysis_results)
 
     print("=== ANALYSIS COMPLETED ===")
     print(f"Report for valid players: {config.OUTPUT_REPORT}")
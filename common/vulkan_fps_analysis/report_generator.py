@@ -2,31 +2,61 @@
 Report and visualization generation for Vulkan FPS analysis
 """
 
+import gzip
+import hashlib
+import io
+import multiprocessing
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache, partial
+from typing import Dict, TextIO
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
 import config
 
 
+@lru_cache(maxsize=1)
+def _pyplot():
+    """
+    Imports matplotlib.pyplot on first use, so text-only callers of this
+    module never load matplotlib; plots are only written to files, so the
+    non-GUI Agg backend is selected before pyplot initializes
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+@lru_cache(maxsize=1)
 def setup_plot_style():
-    """Setup style for plots"""
+    """Setup style for plots (applied once per process)"""
+    import seaborn as sns
+
+    plt = _pyplot()
     plt.style.use(config.PLOT_STYLE)
     sns.set_palette(config.PLOT_PALETTE)
 
 
-def _save_plot(plots_dir: str, filename: str):
-    """Common function for saving plots"""
-    plt.tight_layout()
+def _save_plot(plots_dir: str, filename: str, bbox_inches=None):
+    """
+    Common function for saving plots
+
+    Figures are created with constrained_layout, so no extra layout pass
+    is needed here; pass bbox_inches="tight" only where labels spill out
+    """
+    plt = _pyplot()
     plt.savefig(
         f"{plots_dir}/{filename}",
         dpi=config.PLOT_DPI,
-        bbox_inches="tight",
+        bbox_inches=bbox_inches,
     )
     plt.close()
 
@@ -44,9 +74,60 @@ def _ensure_plots_dir(plots_dir: str = None) -> str:
     return plots_dir
 
 
+# Plots directory already created by this process (None until the first call)
+_PLOTS_DIR_READY = None
+
+
 def create_plots_directory():
-    """Creates directory for plots"""
+    """Creates directory for plots (once per process)"""
+    global _PLOTS_DIR_READY
+    if _PLOTS_DIR_READY == config.PLOTS_DIR:
+        return
     os.makedirs(config.PLOTS_DIR, exist_ok=True)
+    _PLOTS_DIR_READY = config.PLOTS_DIR
+
+
+# Delta columns shown by plot_fps_delta_distribution: (column, metric label, bar color)
+DELTA_HISTOGRAMS = (
+    ("c_FpsAvg_delta", "Average FPS", None),
+    ("c_FpsAvgMin_delta", "Minimum FPS", "orange"),
+    ("c_FpsAvgOnePercentile_delta", "1% Percentile FPS", "green"),
+)
+
+
+def _bin_deltas(deltas: np.ndarray, bins: int = 50) -> list:
+    """
+    Histogram (counts, edges) for every row of a (metrics, players) array;
+    NaNs are dropped per row
+    """
+    binned = []
+    for row in deltas:
+        row = row[~np.isnan(row)]
+        edges = np.histogram_bin_edges(row, bins=bins)
+        counts, _ = np.histogram(row, bins=edges)
+        binned.append((counts, edges))
+    return binned
+
+
+def _plot_histogram(ax, counts: np.ndarray, edges: np.ndarray, **bar_kwargs):
+    """Draws pre-binned histogram counts as bars"""
+    ax.bar(
+        edges[:-1],
+        counts,
+        width=np.diff(edges),
+        align="edge",
+        edgecolor="black",
+        alpha=0.7,
+        **bar_kwargs,
+    )
+
+
+# Metrics of the before/after plots: (column prefix, title)
+BEFORE_AFTER_METRICS = (
+    ("c_FpsAvg", "Average FPS"),
+    ("c_FpsAvgMin", "Minimum FPS"),
+    ("c_FpsAvgOnePercentile", "1% Percentile FPS"),
+)
 
 
 def plot_fps_delta_distribution(
@@ -55,75 +136,75 @@ def plot_fps_delta_distribution(
     """FPS change distribution plot"""
     plots_dir = _ensure_plots_dir(plots_dir)
 
-    _, axes = plt.subplots(1, 3, figsize=(18, 5))
-
-    # Average FPS
-    axes[0].hist(
-        players_comparison["c_FpsAvg_delta"],
-        bins=50,
-        edgecolor="black",
-        alpha=0.7,
-    )
-    axes[0].axvline(0, color="red", linestyle="--", linewidth=2)
-    axes[0].set_xlabel("Change in Average FPS")
-    axes[0].set_ylabel("Number of Players")
-    axes[0].set_title("Distribution of Average FPS Changes")
-    axes[0].grid(True, alpha=0.3)
-
-    # Minimum FPS
-    axes[1].hist(
-        players_comparison["c_FpsAvgMin_delta"],
-        bins=50,
-        edgecolor="black",
-        alpha=0.7,
-        color="orange",
-    )
-    axes[1].axvline(0, color="red", linestyle="--", linewidth=2)
-    axes[1].set_xlabel("Change in Minimum FPS")
-    axes[1].set_ylabel("Number of Players")
-    axes[1].set_title("Distribution of Minimum FPS Changes")
-    axes[1].grid(True, alpha=0.3)
-
-    # 1% percentile FPS
-    axes[2].hist(
-        players_comparison["c_FpsAvgOnePercentile_delta"],
-        bins=50,
-        edgecolor="black",
-        alpha=0.7,
-        color="green",
+    # One (metrics, players) block, each metric contiguous for its binning pass
+    columns = [column for column, _, _ in DELTA_HISTOGRAMS]
+    deltas = np.ascontiguousarray(
+        players_comparison[columns].to_numpy(dtype=float).T
     )
-    axes[2].axvline(0, color="red", linestyle="--", linewidth=2)
-    axes[2].set_xlabel("Change in 1% Percentile FPS")
-    axes[2].set_ylabel("Number of Players")
-    axes[2].set_title("Distribution of 1% Percentile FPS Changes")
-    axes[2].grid(True, alpha=0.3)
+    binned = _bin_deltas(deltas)
+
+    _, axes = _pyplot().subplots(1, 3, figsize=(18, 5), constrained_layout=True)
+
+    for ax, (_, label, color), (counts, edges) in zip(
+        axes, DELTA_HISTOGRAMS, binned
+    ):
+        _plot_histogram(ax, counts, edges, color=color)
+        ax.axvline(0, color="red", linestyle="--", linewidth=2)
+        ax.set_xlabel(f"Change in {label}")
+        ax.set_ylabel("Number of Players")
+        ax.set_title(f"Distribution of {label} Changes")
+        ax.grid(True, alpha=0.3)
 
     _save_plot(plots_dir, "fps_delta_distribution.png")
 
 
+def _box_stats(values: np.ndarray, whis: float = 1.5) -> Dict:
+    """
+    Box plot statistics for ax.bxp, matching ax.boxplot's defaults:
+    whiskers at the furthest points within whis * IQR of the box; a column
+    with no values gets all-NaN stats, which bxp leaves undrawn
+    """
+    arr = values[~np.isnan(values)]
+    if arr.size == 0:
+        stats = dict.fromkeys(("med", "q1", "q3", "mean", "whislo", "whishi"), np.nan)
+        return {**stats, "fliers": arr}
+
+    q1, med, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = arr[(arr >= q1 - whis * iqr) & (arr <= q3 + whis * iqr)]
+    return {
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "mean": arr.mean(),
+        "whislo": inside.min(),
+        "whishi": inside.max(),
+        "fliers": arr[(arr < inside.min()) | (arr > inside.max())],
+    }
+
+
 def plot_fps_before_after_boxplot(
     players_comparison: pd.DataFrame, plots_dir: str = None
 ):
     """Box plot comparing FPS before/after"""
     plots_dir = _ensure_plots_dir(plots_dir)
 
-    _, axes = plt.subplots(1, 3, figsize=(18, 5))
-
-    metrics_to_plot = [
-        ("c_FpsAvg", "Average FPS"),
-        ("c_FpsAvgMin", "Minimum FPS"),
-        ("c_FpsAvgOnePercentile", "1% Percentile FPS"),
-    ]
+    _, axes = _pyplot().subplots(1, 3, figsize=(18, 5), constrained_layout=True)
 
-    for idx, (metric, title) in enumerate(metrics_to_plot):
-        before_data = players_comparison[f"{metric}_before"]
-        after_data = players_comparison[f"{metric}_after"]
+    arrays = {
+        metric: (
+            players_comparison[f"{metric}_before"].to_numpy(dtype=float),
+            players_comparison[f"{metric}_after"].to_numpy(dtype=float),
+        )
+        for metric, _ in BEFORE_AFTER_METRICS
+    }
 
+    for ax, (metric, title) in zip(axes, BEFORE_AFTER_METRICS):
         positions = [1, 2]
-        data_to_plot = [before_data, after_data]
+        stats = [_box_stats(values) for values in arrays[metric]]
 
-        bp = axes[idx].boxplot(
-            data_to_plot,
+        bp = ax.bxp(
+            stats,
             positions=positions,
             widths=0.6,
             patch_artist=True,
@@ -134,15 +215,26 @@ def plot_fps_before_after_boxplot(
         for patch in bp["boxes"]:
             patch.set_facecolor("lightblue")
 
-        axes[idx].set_xticks(positions)
-        axes[idx].set_xticklabels(["Before Vulkan", "After Vulkan"])
-        axes[idx].set_ylabel("FPS")
-        axes[idx].set_title(title)
-        axes[idx].grid(True, alpha=0.3)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(["Before Vulkan", "After Vulkan"])
+        ax.set_ylabel("FPS")
+        ax.set_title(title)
+        ax.grid(True, alpha=0.3)
 
     _save_plot(plots_dir, "fps_before_after_boxplot.png")
 
 
+def _player_count_labels(top_data: pd.DataFrame) -> list:
+    """Tick labels of the form "<name> (n=<player_count>)" for a TOP-N frame"""
+    labels = (
+        top_data.index.astype(str)
+        + " (n="
+        + top_data["player_count"].astype("int64").astype(str)
+        + ")"
+    )
+    return labels.tolist()
+
+
 def plot_top_devices_improvement(
     device_analysis_filtered: pd.DataFrame, plots_dir: str = None
 ):
@@ -154,23 +246,16 @@ def plot_top_devices_improvement(
 
     top_devices = device_analysis_filtered.head(20)
 
-    _, ax = plt.subplots(figsize=(14, 8))
+    _, ax = _pyplot().subplots(figsize=(14, 8), constrained_layout=True)
 
-    colors = [
-        config.COLOR_GREEN if x > 0.5 else config.COLOR_RED
-        for x in top_devices["improvement_rate"]
-    ]
+    rates = top_devices["improvement_rate"].to_numpy(dtype=float)
+    colors = np.where(rates > 0.5, config.COLOR_GREEN, config.COLOR_RED)
 
     y_pos = np.arange(len(top_devices))
-    ax.barh(y_pos, top_devices["improvement_rate"] * 100, color=colors, alpha=0.7)
+    ax.barh(y_pos, rates * 100, color=colors, alpha=0.7)
 
     ax.set_yticks(y_pos)
-    ax.set_yticklabels(
-        [
-            f"{device} (n={int(row['player_count'])})"
-            for device, row in top_devices.iterrows()
-        ]
-    )
+    ax.set_yticklabels(_player_count_labels(top_devices))
     ax.set_xlabel("Percentage of Players with FPS Improvement (%)")
     ax.set_title("TOP-20 Devices by Player Count\n(FPS Improvement Percentage)")
     ax.axvline(50, color="black", linestyle="--", linewidth=1)
@@ -190,20 +275,16 @@ def plot_top_gpu_improvement(
 
     top_gpus = gpu_analysis_filtered.head(20)
 
-    _, ax = plt.subplots(figsize=(14, 8))
+    _, ax = _pyplot().subplots(figsize=(14, 8), constrained_layout=True)
 
-    colors = [
-        config.COLOR_GREEN if x > 0.5 else config.COLOR_RED
-        for x in top_gpus["improvement_rate"]
-    ]
+    rates = top_gpus["improvement_rate"].to_numpy(dtype=float)
+    colors = np.where(rates > 0.5, config.COLOR_GREEN, config.COLOR_RED)
 
     y_pos = np.arange(len(top_gpus))
-    ax.barh(y_pos, top_gpus["improvement_rate"] * 100, color=colors, alpha=0.7)
+    ax.barh(y_pos, rates * 100, color=colors, alpha=0.7)
 
     ax.set_yticks(y_pos)
-    ax.set_yticklabels(
-        [f"{gpu} (n={int(row['player_count'])})" for gpu, row in top_gpus.iterrows()]
-    )
+    ax.set_yticklabels(_player_count_labels(top_gpus))
     ax.set_xlabel("Percentage of Players with FPS Improvement (%)")
     ax.set_title("TOP-20 GPU by Player Count\n(FPS Improvement Percentage)")
     ax.axvline(50, color="black", linestyle="--", linewidth=1)
@@ -212,71 +293,134 @@ def plot_top_gpu_improvement(
     _save_plot(plots_dir, "top_gpu_improvement_rate.png")
 
 
-def plot_fps_scatter(players_comparison: pd.DataFrame, plots_dir: str = None):
-    """Scatter plot: FPS before vs after (for all key metrics)"""
-    plots_dir = _ensure_plots_dir(plots_dir)
+# Point status codes used by the scatter plots, in drawing order
+SCATTER_STATUSES = ("worsened", "unchanged", "improved")
 
-    _, axes = plt.subplots(1, 3, figsize=(20, 6))
 
-    metrics = [
-        ("c_FpsAvg", "Average FPS"),
-        ("c_FpsAvgMin", "Minimum FPS"),
-        ("c_FpsAvgOnePercentile", "1% Percentile FPS"),
-    ]
+def _classify_deltas(delta: np.ndarray) -> np.ndarray:
+    """
+    Status code (index into SCATTER_STATUSES) for every delta;
+    NaN deltas get -1 and are left out of the plot
+    """
+    threshold = config.MINIMUM_CHANGE_THRESHOLD
+    status = np.ones(len(delta), dtype=np.int8)
+    status[delta > threshold] = 2
+    status[delta < -threshold] = 0
+    status[np.isnan(delta)] = -1
+    return status
 
-    for idx, (metric, title) in enumerate(metrics):
-        ax = axes[idx]
 
-        # Determine status for each metric
-        improved = players_comparison[
-            players_comparison[f"{metric}_delta"] > config.MINIMUM_CHANGE_THRESHOLD
-        ]
-        unchanged = players_comparison[
-            abs(players_comparison[f"{metric}_delta"])
-            <= config.MINIMUM_CHANGE_THRESHOLD
-        ]
-        worsened = players_comparison[
-            players_comparison[f"{metric}_delta"] < -config.MINIMUM_CHANGE_THRESHOLD
-        ]
+def _scatter_colors() -> Dict[str, str]:
+    """Point colors for each scatter status"""
+    return {
+        "worsened": config.COLOR_RED,
+        "unchanged": config.COLOR_ORANGE,
+        "improved": config.COLOR_GREEN,
+    }
 
-        # Draw points
-        if len(worsened) > 0:
-            ax.scatter(
-                worsened[f"{metric}_before"],
-                worsened[f"{metric}_after"],
-                alpha=0.5,
-                s=30,
-                c=config.COLOR_RED,
-                label="Worsened",
-            )
-        if len(unchanged) > 0:
+
+def _draw_scatter_matplotlib(
+    ax, before: np.ndarray, after: np.ndarray, status: np.ndarray
+) -> list:
+    """
+    Draws one before/after scatter point by point with ax.scatter;
+    the markers are rasterized as one layer and drawn without edges
+    """
+    colors = _scatter_colors()
+    for code, label in enumerate(SCATTER_STATUSES):
+        mask = status == code
+        if mask.any():
             ax.scatter(
-                unchanged[f"{metric}_before"],
-                unchanged[f"{metric}_after"],
+                before[mask],
+                after[mask],
                 alpha=0.5,
                 s=30,
-                c=config.COLOR_ORANGE,
-                label="Unchanged",
+                c=colors[label],
+                linewidths=0,
+                rasterized=True,
+                label=label.capitalize(),
             )
-        if len(improved) > 0:
-            ax.scatter(
-                improved[f"{metric}_before"],
-                improved[f"{metric}_after"],
-                alpha=0.5,
-                s=30,
-                c=config.COLOR_GREEN,
-                label="Improved",
+    return []
+
+
+def _draw_scatter_datashader(
+    ax, before: np.ndarray, after: np.ndarray, status: np.ndarray, min_val, max_val
+) -> list:
+    """Rasterizes one before/after scatter with datashader and shows it via imshow"""
+    import datashader as ds
+    import datashader.transfer_functions as tf
+    from matplotlib.patches import Patch
+
+    color_key = _scatter_colors()
+    points = pd.DataFrame(
+        {
+            "before": before,
+            "after": after,
+            "status": pd.Categorical.from_codes(status, categories=SCATTER_STATUSES),
+        }
+    )
+
+    canvas = ds.Canvas(
+        plot_width=1200,
+        plot_height=600,
+        x_range=(min_val, max_val),
+        y_range=(min_val, max_val),
+    )
+    agg = canvas.points(points, "before", "after", ds.count_cat("status"))
+    img = tf.shade(agg, color_key=color_key)
+
+    # to_pil() flips the rows so the image is top-down, hence origin="upper"
+    ax.imshow(
+        img.to_pil(),
+        extent=[min_val, max_val, min_val, max_val],
+        origin="upper",
+        aspect="auto",
+    )
+    return [
+        Patch(color=color, label=label.capitalize())
+        for label, color in color_key.items()
+    ]
+
+
+def plot_fps_scatter(
+    players_comparison: pd.DataFrame,
+    plots_dir: str = None,
+    backend: str = "matplotlib",
+):
+    """
+    Scatter plot: FPS before vs after (for all key metrics)
+
+    Args:
+        backend: "matplotlib" draws every point with ax.scatter;
+            "datashader" rasterizes the points into an image first,
+            which stays fast for large player populations
+    """
+    if backend not in ("matplotlib", "datashader"):
+        raise ValueError(f"Unknown scatter backend: {backend}")
+
+    plots_dir = _ensure_plots_dir(plots_dir)
+
+    _, axes = _pyplot().subplots(1, 3, figsize=(20, 6), constrained_layout=True)
+
+    for idx, (metric, title) in enumerate(BEFORE_AFTER_METRICS):
+        ax = axes[idx]
+
+        before = players_comparison[f"{metric}_before"].to_numpy(dtype=float)
+        after = players_comparison[f"{metric}_after"].to_numpy(dtype=float)
+        status = _classify_deltas(
+            players_comparison[f"{metric}_delta"].to_numpy(dtype=float)
+        )
+
+        max_val = max(np.nanmax(before), np.nanmax(after))
+        min_val = min(np.nanmin(before), np.nanmin(after))
+        if backend == "datashader":
+            handles = _draw_scatter_datashader(
+                ax, before, after, status, min_val, max_val
             )
+        else:
+            handles = _draw_scatter_matplotlib(ax, before, after, status)
 
         # y=x line (no changes)
-        max_val = max(
-            players_comparison[f"{metric}_before"].max(),
-            players_comparison[f"{metric}_after"].max(),
-        )
-        min_val = min(
-            players_comparison[f"{metric}_before"].min(),
-            players_comparison[f"{metric}_after"].min(),
-        )
         ax.plot(
             [min_val, max_val],
             [min_val, max_val],
@@ -288,7 +432,7 @@ def plot_fps_scatter(players_comparison: pd.DataFrame, plots_dir: str = None):
         ax.set_xlabel(f"{title} Before Vulkan")
         ax.set_ylabel(f"{title} After Vulkan")
         ax.set_title(f"Comparison: {title}")
-        ax.legend()
+        ax.legend(handles=handles + ax.get_legend_handles_labels()[0])
         ax.grid(True, alpha=0.3)
 
     _save_plot(plots_dir, "fps_before_after_scatter.png")
@@ -298,7 +442,7 @@ def plot_overall_effect_pie(overall_stats: Dict, plots_dir: str = None):
     """Overall effect pie chart"""
     plots_dir = _ensure_plots_dir(plots_dir)
 
-    _, ax = plt.subplots(figsize=(8, 8))
+    _, ax = _pyplot().subplots(figsize=(8, 8), constrained_layout=True)
 
     improved_count = overall_stats["improved_count"]
     unchanged_count = overall_stats["unchanged_count"]
@@ -313,38 +457,204 @@ def plot_overall_effect_pie(overall_stats: Dict, plots_dir: str = None):
     colors = [config.COLOR_IMPROVED, config.COLOR_UNCHANGED, config.COLOR_WORSENED]
     explode = (0.05, 0.05, 0.05)
 
-    ax.pie(
-        sizes,
-        explode=explode,
-        labels=labels,
-        colors=colors,
-        autopct="%1.1f%%",
-        shadow=True,
-        startangle=90,
-        textprops={"fontsize": 12, "weight": "bold"},
-    )
+    # No shadow pass and no pie-managed text; labels and percentages are
+    # placed directly at the distances ax.pie would use (1.1 and 0.6 radii)
+    wedges, _ = ax.pie(sizes, explode=explode, colors=colors, startangle=90)
+
+    total = sum(sizes)
+    text_props = {"fontsize": 12, "weight": "bold"}
+    for wedge, label, size in zip(wedges, labels, sizes):
+        angle = np.deg2rad((wedge.theta1 + wedge.theta2) / 2)
+        cos, sin = np.cos(angle), np.sin(angle)
+        center_x, center_y = wedge.center
+
+        ax.text(
+            center_x + 1.1 * wedge.r * cos,
+            center_y + 1.1 * wedge.r * sin,
+            label,
+            ha="left" if cos > 0 else "right",
+            va="center",
+            **text_props,
+        )
+        ax.text(
+            center_x + 0.6 * wedge.r * cos,
+            center_y + 0.6 * wedge.r * sin,
+            f"{size / total * 100:.1f}%" if total else "0.0%",
+            ha="center",
+            va="center",
+            **text_props,
+        )
     ax.set_title(
         "Overall Distribution of Vulkan Implementation Effect",
         fontsize=14,
         weight="bold",
     )
 
-    _save_plot(plots_dir, "overall_effect_pie.png")
+    # Wedge labels sit outside the axes, so keep the tight bounding box
+    _save_plot(plots_dir, "overall_effect_pie.png", bbox_inches="tight")
 
 
-def generate_all_plots(players_comparison: pd.DataFrame, analysis_results: Dict):
-    """Generates all plots"""
+def _init_plot_worker():
+    """Prepares a plotting process with the shared style"""
     setup_plot_style()
-    plots_dir = _get_plots_dir()
 
-    plot_fps_delta_distribution(players_comparison, plots_dir)
-    plot_fps_before_after_boxplot(players_comparison, plots_dir)
-    plot_top_devices_improvement(
-        analysis_results["device_analysis"]["filtered"], plots_dir
+
+def _metric_columns(*suffixes: str) -> list:
+    """Player comparison columns of the before/after metrics with the suffixes"""
+    return [
+        f"{metric}_{suffix}"
+        for metric, _ in BEFORE_AFTER_METRICS
+        for suffix in suffixes
+    ]
+
+
+def _plot_mp_context():
+    """
+    Start method of the plot workers. The caller may already run thread pools,
+    and forking a threaded process can copy held locks into the child, so the
+    workers come from a fork server (or are spawned where it is unavailable)
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _run_plot(task: tuple):
+    """Runs one (plot function, args, kwargs) task inside a worker"""
+    plot_fn, args, kwargs = task
+    plot_fn(*args, **kwargs)
+
+
+# Sidecar file in the plots directory holding the content hash of the last run
+PLOTS_CACHE_FILE = ".cache_hash"
+
+
+def _plots_cache_key(players_comparison: pd.DataFrame, analysis_results: Dict) -> str:
+    """
+    Content hash of everything the plots are drawn from: the player and
+    TOP-N frames, the overall stats and the plot-related settings
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in (
+        players_comparison,
+        analysis_results["device_analysis"]["filtered"],
+        analysis_results["gpu_analysis"]["filtered"],
+    ):
+        digest.update(repr(list(frame.columns)).encode("utf-8"))
+        row_hashes = pd.util.hash_pandas_object(frame, index=True)
+        digest.update(row_hashes.to_numpy().tobytes())
+
+    settings = (
+        sorted(analysis_results["overall_stats"].items()),
+        config.PLOT_DPI,
+        config.PLOT_STYLE,
+        config.PLOT_PALETTE,
+        config.SCATTER_BACKEND,
+        config.MINIMUM_CHANGE_THRESHOLD,
+        config.COLOR_IMPROVED,
+        config.COLOR_UNCHANGED,
+        config.COLOR_WORSENED,
+        config.COLOR_GREEN,
+        config.COLOR_ORANGE,
+        config.COLOR_RED,
     )
-    plot_top_gpu_improvement(analysis_results["gpu_analysis"]["filtered"], plots_dir)
-    plot_fps_scatter(players_comparison, plots_dir)
-    plot_overall_effect_pie(analysis_results["overall_stats"], plots_dir)
+    digest.update(repr(settings).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_plots_cache_key(plots_dir: str) -> str:
+    """Hash stored by the previous run, or None if there is none"""
+    try:
+        with open(os.path.join(plots_dir, PLOTS_CACHE_FILE), encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def generate_all_plots(players_comparison: pd.DataFrame, analysis_results: Dict):
+    """
+    Generates all plots
+
+    The plots are independent and CPU-bound on rasterization, so each one
+    is rendered in its own process (pyplot state is not thread-safe), which
+    receives only the columns its plot reads. Nothing is redrawn when the
+    inputs hash to the value stored by the previous run and all of its PNGs
+    are still in place
+    """
+    plots_dir = _get_plots_dir()
+    device_filtered = analysis_results["device_analysis"]["filtered"]
+    gpu_filtered = analysis_results["gpu_analysis"]["filtered"]
+    delta_columns = [column for column, _, _ in DELTA_HISTOGRAMS]
+    # The TOP-20 plots read the first 20 rows of these two columns
+    top_columns = ["player_count", "improvement_rate"]
+
+    # (output file, plot function, args, kwargs)
+    tasks = [
+        (
+            "fps_delta_distribution.png",
+            plot_fps_delta_distribution,
+            (players_comparison[delta_columns], plots_dir),
+            {},
+        ),
+        (
+            "fps_before_after_boxplot.png",
+            plot_fps_before_after_boxplot,
+            (players_comparison[_metric_columns("before", "after")], plots_dir),
+            {},
+        ),
+        (
+            "fps_before_after_scatter.png",
+            plot_fps_scatter,
+            (
+                players_comparison[_metric_columns("before", "after", "delta")],
+                plots_dir,
+            ),
+            {"backend": config.SCATTER_BACKEND},
+        ),
+        (
+            "overall_effect_pie.png",
+            plot_overall_effect_pie,
+            (analysis_results["overall_stats"], plots_dir),
+            {},
+        ),
+    ]
+    # The TOP-20 plots draw nothing for an empty selection
+    if len(device_filtered) > 0:
+        tasks.append(
+            (
+                "top_devices_improvement_rate.png",
+                plot_top_devices_improvement,
+                (device_filtered[top_columns].head(20), plots_dir),
+                {},
+            )
+        )
+    if len(gpu_filtered) > 0:
+        tasks.append(
+            (
+                "top_gpu_improvement_rate.png",
+                plot_top_gpu_improvement,
+                (gpu_filtered[top_columns].head(20), plots_dir),
+                {},
+            )
+        )
+
+    cache_key = _plots_cache_key(players_comparison, analysis_results)
+    if _read_plots_cache_key(plots_dir) == cache_key and all(
+        os.path.exists(os.path.join(plots_dir, filename)) for filename, *_ in tasks
+    ):
+        return
+
+    max_workers = min(os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=_plot_mp_context(),
+        initializer=_init_plot_worker,
+    ) as executor:
+        # list() re-raises the first exception from a failed plot
+        list(executor.map(_run_plot, [task[1:] for task in tasks]))
+
+    with open(os.path.join(plots_dir, PLOTS_CACHE_FILE), "w", encoding="utf-8") as f:
+        f.write(cache_key)
 
 
 def _get_metric_names_map() -> Dict[str, str]:
@@ -363,9 +673,12 @@ def _create_table_header(columns: list) -> str:
     return header + separator
 
 
-def _create_table_row(values: list) -> str:
-    """Creates table row"""
-    return "| " + " | ".join(str(v) for v in values) + " |\n"
+def _format_column(
+    data: pd.DataFrame, column: str, fmt: str, scale: float = 1
+) -> pd.Series:
+    """Formats a whole column at once; missing columns are rendered as 0"""
+    values = data[column] if column in data else pd.Series(0.0, index=data.index)
+    return (values * scale).map(fmt.format)
 
 
 def _create_analysis_table(
@@ -385,19 +698,28 @@ def _create_analysis_table(
         "After (AVG)",
         "Δ (AVG)",
     ]
-    table = _create_table_header(columns)
-
-    for idx, (name, row) in enumerate(top_data.iterrows(), 1):
-        values = [
-            idx,
-            name,
-            int(row["player_count"]),
-            f"{row['improvement_rate']*100:.1f}%",
-            f"{row.get('c_FpsAvg_before', 0):.1f}",
-            f"{row.get('c_FpsAvg_after', 0):.1f}",
-            f"{row.get('c_FpsAvg_delta', 0):+.2f}",
-        ]
-        table += _create_table_row(values)
+
+    out = pd.DataFrame(
+        {
+            "#": range(1, len(top_data) + 1),
+            "Name": top_data.index,
+            "Players": top_data["player_count"].astype(int).to_numpy(),
+            "% Improved": _format_column(
+                top_data, "improvement_rate", "{:.1f}%", scale=100
+            ).to_numpy(),
+            "Before (AVG)": _format_column(
+                top_data, "c_FpsAvg_before", "{:.1f}"
+            ).to_numpy(),
+            "After (AVG)": _format_column(
+                top_data, "c_FpsAvg_after", "{:.1f}"
+            ).to_numpy(),
+            "Δ (AVG)": _format_column(
+                top_data, "c_FpsAvg_delta", "{:+.2f}"
+            ).to_numpy(),
+        }
+    )
+    rows = ("| " + out.astype(str).agg(" | ".join, axis=1) + " |").tolist()
+    table = _create_table_header(columns) + "\n".join(rows) + "\n"
 
     return f"### {title}\n\n{table}\n"
 
@@ -409,7 +731,8 @@ def _create_analysis_section(
     improved = analysis_data["improved"]
     worsened = analysis_data["worsened"]
 
-    section = f"""## {section_title}
+    parts = [
+        f"""## {section_title}
 
 ### Methodology
 
@@ -422,30 +745,36 @@ def _create_analysis_section(
 **Count:** {len(improved)}
 
 """
+    ]
 
     if len(improved) > 0:
-        section += _create_analysis_table(
-            improved, f"{section_title} with Stable Improvement"
+        parts.append(
+            _create_analysis_table(improved, f"{section_title} with Stable Improvement")
         )
     else:
-        section += f"*No {section_title.lower()} meeting stable improvement criteria*\n"
+        parts.append(
+            f"*No {section_title.lower()} meeting stable improvement criteria*\n"
+        )
 
-    section += f"""
+    parts.append(
+        f"""
 
 ### 🔴 {section_title} with Stable Worsening
 
 **Count:** {len(worsened)}
 
 """
+    )
 
     if len(worsened) > 0:
-        section += _create_analysis_table(
-            worsened, f"{section_title} with Stable Worsening"
+        parts.append(
+            _create_analysis_table(worsened, f"{section_title} with Stable Worsening")
         )
     else:
-        section += f"*No {section_title.lower()} meeting stable worsening criteria*\n"
+        parts.append(f"*No {section_title.lower()} meeting stable worsening criteria*\n")
 
-    section += f"""
+    parts.append(
+        f"""
 
 ### TOP-20 {section_title.lower()} by player count
 
@@ -453,7 +782,8 @@ def _create_analysis_section(
 
 ---
 """
-    return section
+    )
+    return "".join(parts)
 
 
 def _build_report_header() -> str:
@@ -669,32 +999,40 @@ def _build_overall_results_section(overall_stats: Dict, plots_dir: str = None) -
 """
 
 
+# Markdown block for one paired t-test result, filled by str.format
+_STAT_TEST_TEMPLATE = (
+    "#### {name}\n"
+    "\n"
+    "| Parameter | Value |\n"
+    "|-----------|-------|\n"
+    "| t-statistic | {t:.4f} |\n"
+    "| p-value | {p:.6f} |\n"
+    "| Direction | {direction} |\n"
+    "| Result | {significance} |\n"
+    "\n"
+)
+_STAT_TEST_DIRECTIONS = {"improvement": "↑ Improvement"}
+_STAT_TEST_SIGNIFICANCE = {
+    True: "✅ **STATISTICALLY SIGNIFICANT**",
+    False: "❌ **NOT SIGNIFICANT**",
+}
+
+
 def _format_statistical_test_result(metric_name: str, test_result: Dict) -> str:
     """Formats result of one statistical test"""
-    significance = (
-        "✅ **STATISTICALLY SIGNIFICANT**"
-        if test_result["is_significant"]
-        else "❌ **NOT SIGNIFICANT**"
-    )
-    direction = (
-        "↑ Improvement" if test_result["direction"] == "improvement" else "↓ Worsening"
+    return _STAT_TEST_TEMPLATE.format(
+        name=metric_name,
+        t=test_result["t_statistic"],
+        p=test_result["p_value"],
+        direction=_STAT_TEST_DIRECTIONS.get(test_result["direction"], "↓ Worsening"),
+        significance=_STAT_TEST_SIGNIFICANCE[bool(test_result["is_significant"])],
     )
 
-    return f"""#### {metric_name}
-
-| Parameter | Value |
-|-----------|-------|
-| t-statistic | {test_result['t_statistic']:.4f} |
-| p-value | {test_result['p_value']:.6f} |
-| Direction | {direction} |
-| Result | {significance} |
-
-"""
-
 
 def _build_statistical_analysis_section(statistical_tests: Dict) -> str:
     """Forms section with statistical analysis"""
-    section = f"""## Statistical Analysis
+    parts = [
+        f"""## Statistical Analysis
 
 ### Paired Student's t-test
 
@@ -705,13 +1043,15 @@ Tests the hypothesis about significance of FPS change after Vulkan implementatio
 **Significance level:** α = {config.SIGNIFICANCE_LEVEL}
 
 """
+    ]
 
     metric_names_map = _get_metric_names_map()
     for metric_key, test_result in statistical_tests.items():
         metric_name = metric_names_map.get(metric_key, metric_key)
-        section += _format_statistical_test_result(metric_name, test_result)
+        parts.append(_format_statistical_test_result(metric_name, test_result))
 
-    section += """### Interpretation
+    parts.append(
+        """### Interpretation
 
 - **p-value < 0.05** means the change is statistically significant (probability of randomness < 5%)
 - **t-statistic > 0** indicates positive change (improvement)
@@ -719,7 +1059,8 @@ Tests the hypothesis about significance of FPS change after Vulkan implementatio
 
 ---
 """
-    return section
+    )
+    return "".join(parts)
 
 
 def _build_device_analysis_section(device_analysis: Dict, plots_dir: str = None) -> str:
@@ -798,6 +1139,68 @@ def _format_significance_conclusion(
     )
 
 
+_CONCLUSIONS_OVERVIEW_TEMPLATE = """## Conclusions and Recommendations
+
+### Overall Conclusions
+
+{emoji} **Overall effect of Vulkan implementation: {conclusion}**
+
+1. **Audience coverage:**
+   - {s[total_count]} players participated in the analysis
+   - {s[improved_count]} players ({s[improved_pct]:.1f}%) showed FPS improvement
+   - {s[unchanged_count]} players ({s[unchanged_pct]:.1f}%) remained unchanged
+   - {s[worsened_count]} players ({s[worsened_pct]:.1f}%) showed FPS worsening
+
+2. **Changes by metrics:**
+   - Average FPS: {s[avg_delta_mean]:+.2f} FPS ({s[avg_pct_change_mean]:+.2f}%)
+   - Minimum FPS: {s[min_delta_mean]:+.2f} FPS ({s[min_pct_change_mean]:+.2f}%)
+   - 1% Percentile FPS: {s[percentile_1_delta_mean]:+.2f} FPS ({s[percentile_1_pct_change_mean]:+.2f}%)
+   
+   *Note: percentage change = (delta) / (before value) × 100%*
+
+3. **Statistical significance:**
+"""
+_GROUP_CONCLUSIONS_TEMPLATE = (
+    "\n"
+    "\n"
+    "### {title} Conclusions\n"
+    "\n"
+    "- **{label} with stable improvement:** {improved}\n"
+    "- **{label} with stable worsening:** {worsened}\n"
+)
+_GROUP_LEADER_TEMPLATE = (
+    "\n**{title}:** {name} ({rate:.1f}% players, Δ={delta:.2f} FPS)\n"
+)
+
+
+def _format_group_leader(title: str, group: pd.DataFrame) -> str:
+    """Formats the first (leading) row of a device/GPU group"""
+    top = group.iloc[0]
+    return _GROUP_LEADER_TEMPLATE.format(
+        title=title,
+        name=group.index[0],
+        rate=top["improvement_rate"] * 100,
+        delta=top["c_FpsAvg_delta"],
+    )
+
+
+def _format_group_conclusions(title: str, label: str, group_analysis: Dict) -> str:
+    """Formats the conclusions block of the device or GPU analysis"""
+    improved = group_analysis["improved"]
+    worsened = group_analysis["worsened"]
+
+    parts = [
+        _GROUP_CONCLUSIONS_TEMPLATE.format(
+            title=title, label=label, improved=len(improved), worsened=len(worsened)
+        )
+    ]
+    if len(improved) > 0:
+        parts.append(_format_group_leader("Improvement leader", improved))
+    if len(worsened) > 0:
+        parts.append(_format_group_leader("Greatest worsening", worsened))
+    return "".join(parts)
+
+
 def _build_conclusions_section(
     overall_stats: Dict,
     statistical_tests: Dict,
@@ -818,79 +1221,123 @@ def _build_conclusions_section(
         overall_conclusion = "negative"
         overall_emoji = "⚠️"
 
-    section = f"""## Conclusions and Recommendations
-
-### Overall Conclusions
-
-{overall_emoji} **Overall effect of Vulkan implementation: {overall_conclusion.upper()}**
-
-1. **Audience coverage:**
-   - {overall_stats['total_count']} players participated in the analysis
-   - {overall_stats['improved_count']} players ({overall_stats['improved_pct']:.1f}%) showed FPS improvement
-   - {overall_stats['unchanged_count']} players ({overall_stats['unchanged_pct']:.1f}%) remained unchanged
-   - {overall_stats['worsened_count']} players ({overall_stats['worsened_pct']:.1f}%) showed FPS worsening
-
-2. **Changes by metrics:**
-   - Average FPS: {overall_stats['avg_delta_mean']:+.2f} FPS ({overall_stats['avg_pct_change_mean']:+.2f}%)
-   - Minimum FPS: {overall_stats['min_delta_mean']:+.2f} FPS ({overall_stats['min_pct_change_mean']:+.2f}%)
-   - 1% Percentile FPS: {overall_stats['percentile_1_delta_mean']:+.2f} FPS ({overall_stats['percentile_1_pct_change_mean']:+.2f}%)
-   
-   *Note: percentage change = (delta) / (before value) × 100%*
-
-3. **Statistical significance:**
-"""
+    parts = [
+        _CONCLUSIONS_OVERVIEW_TEMPLATE.format(
+            emoji=overall_emoji, conclusion=overall_conclusion.upper(), s=overall_stats
+        )
+    ]
 
     metric_names_map = _get_metric_names_map()
     for metric_key, test_result in statistical_tests.items():
-        section += _format_significance_conclusion(
-            metric_key, test_result, metric_names_map
+        parts.append(
+            _format_significance_conclusion(metric_key, test_result, metric_names_map)
         )
 
-    devices_improved = device_analysis["improved"]
-    devices_worsened = device_analysis["worsened"]
+    parts.append(_format_group_conclusions("Device", "Devices", device_analysis))
+    parts.append(_format_group_conclusions("GPU", "GPU", gpu_analysis))
 
-    section += f"""
+    parts.append(
+        """
 
-### Device Conclusions
+---
 
-- **Devices with stable improvement:** {len(devices_improved)}
-- **Devices with stable worsening:** {len(devices_worsened)}
+**End of Report**
 """
+    )
+    return "".join(parts)
 
-    if len(devices_improved) > 0:
-        top_device = devices_improved.iloc[0]
-        section += f"\n**Improvement leader:** {devices_improved.index[0]} ({top_device['improvement_rate']*100:.1f}% players, Δ={top_device['c_FpsAvg_delta']:.2f} FPS)\n"
 
-    if len(devices_worsened) > 0:
-        worst_device = devices_worsened.iloc[0]
-        section += f"\n**Greatest worsening:** {devices_worsened.index[0]} ({worst_device['improvement_rate']*100:.1f}% players, Δ={worst_device['c_FpsAvg_delta']:.2f} FPS)\n"
+def _content_key(value):
+    """
+    Hashable fingerprint of a section argument, derived from its content.
+    Frames are reduced to a digest of their ordered row hashes, so the key
+    follows row order and does not keep the frame alive
+    """
+    if isinstance(value, pd.DataFrame):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(value.columns)).encode("utf-8"))
+        row_hashes = pd.util.hash_pandas_object(value, index=True)
+        digest.update(row_hashes.to_numpy().tobytes())
+        return digest.hexdigest()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _content_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_content_key(item) for item in value)
+    return value
 
-    gpu_improved = gpu_analysis["improved"]
-    gpu_worsened = gpu_analysis["worsened"]
 
-    section += f"""
+# Seven cached sections per report, so two full reports fit
+SECTION_CACHE_SIZE = 16
+_section_cache: "OrderedDict[tuple, str]" = OrderedDict()
 
-### GPU Conclusions
 
-- **GPU with stable improvement:** {len(gpu_improved)}
-- **GPU with stable worsening:** {len(gpu_worsened)}
-"""
+def _cached_section(builder, *args) -> str:
+    """
+    Section text for the given inputs, rebuilt only when the inputs or the
+    config values the sections read have changed since an earlier call
+    """
+    config_key = repr(
+        sorted((name, value) for name, value in vars(config).items() if name.isupper())
+    )
+    key = (builder.__name__, config_key, tuple(_content_key(arg) for arg in args))
+    text = _section_cache.get(key)
+    if text is None:
+        text = builder(*args)
+        _section_cache[key] = text
+        if len(_section_cache) > SECTION_CACHE_SIZE:
+            _section_cache.popitem(last=False)
+    else:
+        _section_cache.move_to_end(key)
+    return text
 
-    if len(gpu_improved) > 0:
-        top_gpu = gpu_improved.iloc[0]
-        section += f"\n**Improvement leader:** {gpu_improved.index[0]} ({top_gpu['improvement_rate']*100:.1f}% players, Δ={top_gpu['c_FpsAvg_delta']:.2f} FPS)\n"
 
-    if len(gpu_worsened) > 0:
-        worst_gpu = gpu_worsened.iloc[0]
-        section += f"\n**Greatest worsening:** {gpu_worsened.index[0]} ({worst_gpu['improvement_rate']*100:.1f}% players, Δ={worst_gpu['c_FpsAvg_delta']:.2f} FPS)\n"
+# Write buffer for the streamed report: its many section writes reach the
+# OS in 1 MiB blocks; the file is flushed on close
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-    section += """
 
----
+def write_markdown_report(
+    out: TextIO,
+    metadata: Dict,
+    analysis_results: Dict,
+    plots_dir: str = None,
+):
+    """
+    Writes the full Markdown report section by section to a text stream,
+    so the complete report never has to exist as one string
 
-**End of Report**
-"""
-    return section
+    Args:
+        plots_dir: directory the plot links point to (config.PLOTS_DIR by default)
+    """
+    overall_stats = analysis_results["overall_stats"]
+    statistical_tests = analysis_results["statistical_tests"]
+    device_analysis = analysis_results["device_analysis"]
+    gpu_analysis = analysis_results["gpu_analysis"]
+
+    if plots_dir is None:
+        plots_dir = config.PLOTS_DIR
+
+    # The header carries the current time, every other section is cached
+    out.write(_build_report_header())
+    out.write(_cached_section(_build_data_loading_section, metadata))
+    out.write(
+        _cached_section(_build_overall_results_section, overall_stats, plots_dir)
+    )
+    out.write(_cached_section(_build_statistical_analysis_section, statistical_tests))
+    out.write(
+        _cached_section(_build_device_analysis_section, device_analysis, plots_dir)
+    )
+    out.write(_cached_section(_build_gpu_analysis_section, gpu_analysis, plots_dir))
+    out.write(_cached_section(_build_visualizations_section, plots_dir))
+    out.write(
+        _cached_section(
+            _build_conclusions_section,
+            overall_stats,
+            statistical_tests,
+            device_analysis,
+            gpu_analysis,
+        )
+    )
 
 
 def generate_markdown_report(
@@ -904,44 +1351,348 @@ def generate_markdown_report(
     Returns:
         String with report content in Markdown format
     """
-    overall_stats = analysis_results["overall_stats"]
-    statistical_tests = analysis_results["statistical_tests"]
-    device_analysis = analysis_results["device_analysis"]
-    gpu_analysis = analysis_results["gpu_analysis"]
+    out = io.StringIO()
+    write_markdown_report(out, metadata, analysis_results)
+    return out.getvalue()
+
+
+def save_markdown_report(
+    filepath: str, metadata: Dict, analysis_results: Dict, plots_dir: str = None
+):
+    """
+    Generates the Markdown report straight into a file; each section goes
+    through the write buffer as soon as it is built, so peak memory holds
+    one section rather than the whole report
+    """
+    with open(filepath, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+        write_markdown_report(f, metadata, analysis_results, plots_dir)
 
-    report = _build_report_header()
-    plots_dir = config.PLOTS_DIR
-
-    report += _build_data_loading_section(metadata)
-    report += _build_overall_results_section(overall_stats, plots_dir)
-    report += _build_statistical_analysis_section(statistical_tests)
-    report += _build_device_analysis_section(device_analysis, plots_dir)
-    report += _build_gpu_analysis_section(gpu_analysis, plots_dir)
-    report += _build_visualizations_section(plots_dir)
-    report += _build_conclusions_section(
-        overall_stats, statistical_tests, device_analysis, gpu_analysis
-    )
 
-    return report
+def _write_bytes(filepath: str, data: bytes, dir_fd: int = None):
+    """Writes bytes to a file with raw os.write calls, no Python file object"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    fd = os.open(filepath, flags, 0o644, dir_fd=dir_fd)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Suffix of the sidecar file holding the content digest of an output
+DIGEST_SUFFIX = ".b2"
+
+# Whether files can be opened relative to a directory descriptor here
+_HAS_DIR_FD = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _write_if_changed(filepath: str, data: bytes, encode=None) -> bool:
+    """
+    Writes data (passed through encode, e.g. a compressor, if given) unless
+    the file already holds the same content, judged by a blake2b digest of
+    data kept in "<filepath>.b2". The sidecar also records the size and
+    mtime of the file it describes and is trusted only while they match, so
+    a file rewritten by anything else is rewritten here too. Returns whether
+    the file was written
+
+    The output, its digest check and the sidecar are all opened relative
+    to one descriptor of the output directory, so its path is resolved once
+    """
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    directory, name = os.path.split(filepath)
+    if _HAS_DIR_FD:
+        dir_fd = os.open(directory or ".", os.O_RDONLY | os.O_DIRECTORY)
+    else:
+        dir_fd, name = None, filepath
+    try:
+        digest_name = name + DIGEST_SUFFIX
+        try:
+            stat = os.stat(name, dir_fd=dir_fd)
+            opener = partial(os.open, dir_fd=dir_fd)
+            with open(digest_name, encoding="utf-8", opener=opener) as f:
+                recorded = f.read().split()
+            if recorded == [digest, str(stat.st_size), str(stat.st_mtime_ns)]:
+                return False
+        except FileNotFoundError:
+            pass
+
+        _write_bytes(name, encode(data) if encode else data, dir_fd)
+        stat = os.stat(name, dir_fd=dir_fd)
+        record = f"{digest} {stat.st_size} {stat.st_mtime_ns}"
+        _write_bytes(digest_name, record.encode("ascii"), dir_fd)
+        return True
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
 
 def save_report(report_content: str, filepath: str):
-    """Saves report to file"""
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(report_content)
+    """
+    Saves report to file, encoded to UTF-8 once and written in one go;
+    an unchanged report is not rewritten
+    """
+    _write_if_changed(filepath, report_content.encode("utf-8"))
+
+
+# Characters that make the csv writer quote a field
+_CSV_SPECIAL_CHARS = re.compile(r'[,"\r\n]')
+
+# infer_dtype results whose str() matches what DataFrame.to_csv writes
+_CSV_PLAIN_OBJECT_TYPES = {
+    "string",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "boolean",
+    "empty",
+}
+
+
+def _csv_float_cells(values: np.ndarray) -> np.ndarray:
+    """
+    Cells of a float column. Formatting a float is the costly part of a
+    numeric CSV, and FPS medians and deltas repeat heavily, so a column
+    with few distinct values is factorized and each distinct value is
+    formatted once; code -1 (NaN) picks the trailing ""
+    """
+    # float32 is widened by astype(object), so it is stringified by numpy
+    to_text = str if values.dtype.itemsize < 8 else object
+
+    # factorize folds -0.0 into 0.0, so columns holding -0.0 skip it
+    has_negative_zero = np.signbit(values[values == 0]).any()
+    if not has_negative_zero:
+        codes, uniques = pd.factorize(values)
+        if len(uniques) <= len(values) // 2:
+            texts = uniques.astype(to_text).astype(str).astype(object)
+            return np.append(texts, "")[codes]
+
+    # str() of a Python float is its shortest repr, as pandas writes it
+    cells = values.astype(to_text).astype(object)
+    cells[np.isnan(values)] = ""
+    return cells
+
+
+def _csv_column_cells(column: pd.Series):
+    """
+    Cells of one column as objects whose str() is exactly what
+    DataFrame.to_csv writes (missing values become ""), or None if the
+    column needs the pandas writer (quoting, dates, extension dtypes)
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Stringify the categories once; code -1 (missing) picks the trailing ""
+        categories = _csv_column_cells(
+            pd.Series(column.cat.categories.astype(object))
+        )
+        if categories is None:
+            return None
+        return np.append(categories, "")[column.cat.codes.to_numpy()]
+    if not isinstance(column.dtype, np.dtype):
+        return None
+
+    values = column.to_numpy()
+    if values.dtype.kind in "iub":
+        return values.astype(object)
+    if values.dtype.kind == "f":
+        return _csv_float_cells(values)
+    if values.dtype.kind != "O":
+        return None
+
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind not in _CSV_PLAIN_OBJECT_TYPES:
+        return None
+    missing = pd.isna(values)
+    cells = values.copy()
+    cells[missing] = ""
+    if kind == "string" and _CSV_SPECIAL_CHARS.search("".join(cells)):
+        return None
+    return cells
+
+
+def _frame_to_csv_text(df: pd.DataFrame, index: bool = False):
+    """
+    Renders a DataFrame as CSV text identical to DataFrame.to_csv.
+
+    All cells are laid out row-major with one numpy column_stack and
+    formatted by a single repeated "%s,...\n" template in C, instead of
+    pandas' per-cell formatting. Returns None for frames with cells that
+    need quoting or non-numpy dtypes, which are left to to_csv
+    """
+    frame = df
+    if index:
+        names = list(df.index.names)
+        if None in names or set(names) & set(df.columns):
+            return None
+        frame = df.reset_index()
+
+    header = [str(name) for name in frame.columns]
+    # A lone empty field is written quoted, so one-column frames go to pandas
+    if len(header) < 2 or any(_CSV_SPECIAL_CHARS.search(name) for name in header):
+        return None
+
+    columns = []
+    for _, column in frame.items():
+        cells = _csv_column_cells(column)
+        if cells is None:
+            return None
+        columns.append(cells)
+
+    row_template = ",".join(["%s"] * len(columns)) + "\n"
+    cells = np.column_stack(columns).ravel().tolist() if len(frame) else []
+    return ",".join(header) + "\n" + (row_template * len(frame)) % tuple(cells)
+
+
+def _write_csv(df: pd.DataFrame, filepath: str, index: bool = False):
+    """
+    Writes a DataFrame as CSV, formatted by Arrow's writer if config.ARROW_CSV
+    is set. Outputs of at least config.CSV_GZIP_MIN_BYTES go to "<filepath>.gz"
+    instead, compressed at gzip level 1; whichever variant is not written is
+    removed, so a stale copy from an earlier run never sits next to the new file
+    """
+    if config.ARROW_CSV:
+        data = _arrow_csv_bytes(df, index=index)
+    else:
+        text = _frame_to_csv_text(df, index=index)
+        if text is None:
+            text = df.to_csv(index=index)
+        data = text.encode("utf-8")
+
+    threshold = config.CSV_GZIP_MIN_BYTES
+    compress = threshold is not None and len(data) >= threshold
+    target = f"{filepath}.gz" if compress else filepath
+    stale_path = filepath if compress else f"{filepath}.gz"
+    for path in (stale_path, stale_path + DIGEST_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+    # Hashed before compression, so an unchanged frame skips gzip as well;
+    # mtime=0 keeps the archive bytes identical for identical content
+    encode = partial(gzip.compress, compresslevel=1, mtime=0) if compress else None
+    _write_if_changed(target, data, encode=encode)
+
+
+def _arrow_csv_bytes(df: pd.DataFrame, index: bool = False) -> bytes:
+    """Formats the CSV in Arrow's multi-threaded C++ writer"""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink, pacsv.WriteOptions(include_header=True))
+    return sink.getvalue().to_pybytes()
+
+
+def _write_parquet(df: pd.DataFrame, filepath: str, index: bool = False):
+    """Writes a DataFrame as a zstd-compressed Parquet file"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    frame = df.reset_index() if index else df
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    pq.write_table(table, filepath, compression="zstd")
+
+
+def _write_arrow(df: pd.DataFrame, filepath: str, index: bool = False):
+    """
+    Writes a DataFrame as an uncompressed Arrow IPC (Feather v2) file,
+    which readers can memory-map and use without copying or parsing
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    frame = df.reset_index() if index else df
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    feather.write_feather(table, filepath, compression="uncompressed")
+
+
+def _compact_for_csv(analysis_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Device/GPU analysis frame prepared for its CSV: the name index becomes
+    a regular column and float64 statistics are narrowed to float32, whose
+    shorter repr is plenty for report-style means and rates
+    """
+    frame = analysis_df.reset_index()
+    float_columns = frame.select_dtypes("float64").columns
+    return frame.astype(dict.fromkeys(float_columns, "float32"))
+
+
+def _table_outputs(players_comparison: pd.DataFrame, analysis_results: Dict) -> list:
+    """
+    (writer, frame, path, write index) for every table output: a CSV per
+    frame plus a Parquet sibling wherever its config path is set, and all
+    three as sibling Arrow IPC files in one directory
+    """
+    frames = [
+        # Detailed player data
+        (
+            players_comparison,
+            config.OUTPUT_PLAYERS_CSV,
+            config.OUTPUT_PLAYERS_PARQUET,
+            "players",
+            False,
+        ),
+        # Analysis by devices
+        (
+            analysis_results["device_analysis"]["full"],
+            config.OUTPUT_DEVICES_CSV,
+            config.OUTPUT_DEVICES_PARQUET,
+            "devices",
+            True,
+        ),
+        # Analysis by GPU
+        (
+            analysis_results["gpu_analysis"]["full"],
+            config.OUTPUT_GPU_CSV,
+            config.OUTPUT_GPU_PARQUET,
+            "gpu",
+            True,
+        ),
+    ]
+
+    outputs = []
+    for df, csv_path, parquet_path, arrow_name, index in frames:
+        if index:
+            outputs.append((_write_csv, _compact_for_csv(df), csv_path, False))
+        else:
+            outputs.append((_write_csv, df, csv_path, index))
+        if parquet_path:
+            outputs.append((_write_parquet, df, parquet_path, index))
+        # Tables for downstream consumers that memory-map them
+        if config.OUTPUT_ARROW_DIR:
+            arrow_path = os.path.join(config.OUTPUT_ARROW_DIR, f"{arrow_name}.arrow")
+            outputs.append((_write_arrow, df, arrow_path, index))
+    return outputs
 
 
 def save_csv_outputs(players_comparison: pd.DataFrame, analysis_results: Dict):
-    """Saves CSV files with results"""
-    # Detailed player data
-    players_comparison.to_csv(config.OUTPUT_PLAYERS_CSV, index=False, encoding="utf-8")
+    """Saves CSV files (and their Parquet siblings) with results"""
+    for write, df, filepath, index in _table_outputs(
+        players_comparison, analysis_results
+    ):
+        write(df, filepath, index=index)
 
-    # Analysis by devices
-    analysis_results["device_analysis"]["full"].to_csv(
-        config.OUTPUT_DEVICES_CSV, encoding="utf-8"
-    )
 
-    # Analysis by GPU
-    analysis_results["gpu_analysis"]["full"].to_csv(
-        config.OUTPUT_GPU_CSV, encoding="utf-8"
-    )
+def save_all_outputs(
+    players_comparison: pd.DataFrame, metadata: Dict, analysis_results: Dict
+):
+    """
+    Saves the Markdown report and the table files
+
+    The files are independent, so they are written from parallel threads
+    and their write syscalls overlap
+    """
+    outputs = _table_outputs(players_comparison, analysis_results)
+    with ThreadPoolExecutor(max_workers=len(outputs) + 1) as executor:
+        futures = [
+            executor.submit(
+                save_markdown_report, config.OUTPUT_REPORT, metadata, analysis_results
+            )
+        ]
+        futures.extend(
+            executor.submit(write, df, filepath, index=index)
+            for write, df, filepath, index in outputs
+        )
+        # Re-raise the first failed write
+        for future in futures:
+            future.result()
@@ -0,0 +1,9 @@
+"""
+The analysis modules import each other as top-level scripts (`import config`),
+so their directory goes on sys.path, as when main.py is run from it
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
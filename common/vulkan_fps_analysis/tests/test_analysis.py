@@ -0,0 +1,50 @@
+"""
+Tests for data loading and mission splitting
+"""
+
+import numpy as np
+
+import analysis
+import config
+
+
+def _write_inputs(tmp_path, mission_ids):
+    """Writes offer_fps/client_info CSVs with one session per mission id"""
+    offer_fps = tmp_path / "offer_fps.csv"
+    client_info = tmp_path / "client_info.csv"
+    columns = ["SessionId", "AccountId", "s_MissionId", "DeviceModel"]
+    columns += ["c_GraphicsDeviceName"] + config.FPS_METRICS
+
+    lines = [",".join(columns)]
+    for session_id, mission_id in enumerate(mission_ids):
+        fps = ["30"] * len(config.FPS_METRICS)
+        lines.append(",".join([str(session_id), "a", mission_id, "D", "G"] + fps))
+    offer_fps.write_text("\n".join(lines) + "\n")
+
+    sessions = [f"{session_id},Vulkan" for session_id in range(len(mission_ids))]
+    client_info.write_text("SessionId,c_GraphicsDeviceType\n" + "\n".join(sessions))
+    return str(offer_fps), str(client_info)
+
+
+def test_split_by_mission_drops_rows_without_mission(tmp_path):
+    before, after = str(config.MISSION_BEFORE), str(config.MISSION_AFTER)
+    paths = _write_inputs(tmp_path, [before, "", after, ""])
+
+    df = analysis.load_and_merge_data(*paths)
+    df_before, df_after = analysis.split_by_mission(df)
+
+    assert df["s_MissionId"].dtype == np.float64
+    assert df_before["SessionId"].tolist() == [0]
+    assert df_after["SessionId"].tolist() == [2]
+
+
+def test_split_by_mission_without_missing_values(tmp_path):
+    before, after = str(config.MISSION_BEFORE), str(config.MISSION_AFTER)
+    paths = _write_inputs(tmp_path, [before, after, after])
+
+    df_before, df_after = analysis.split_by_mission(
+        analysis.load_and_merge_data(*paths)
+    )
+
+    assert len(df_before) == 1
+    assert len(df_after) == 2
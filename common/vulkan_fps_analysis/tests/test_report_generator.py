@@ -0,0 +1,167 @@
+"""
+Tests for report tables and plot statistics
+"""
+
+import gzip
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import config
+import report_generator
+
+
+def _analysis_frame():
+    return pd.DataFrame(
+        {
+            "player_count": [10.0, 5.0],
+            "improvement_rate": [0.8, 0.25],
+            "c_FpsAvg_before": [30.123, np.nan],
+            "c_FpsAvg_after": [31.0, 39.95],
+            "c_FpsAvg_delta": [0.877, -0.05],
+        },
+        index=pd.Index(["Device A", "Device B"], name="DeviceModel"),
+    )
+
+
+def test_analysis_table_renders_without_tabulate(monkeypatch):
+    # None in sys.modules makes "import tabulate" raise ImportError
+    monkeypatch.setitem(sys.modules, "tabulate", None)
+
+    table = report_generator._create_analysis_table(_analysis_frame(), "Devices")
+
+    assert table == (
+        "### Devices\n"
+        "\n"
+        "| # | Name | Players | % Improved | Before (AVG) | After (AVG) | Δ (AVG) |\n"
+        "|---|---|---|---|---|---|---|\n"
+        "| 1 | Device A | 10 | 80.0% | 30.1 | 31.0 | +0.88 |\n"
+        "| 2 | Device B | 5 | 25.0% | nan | 40.0 | -0.05 |\n"
+        "\n"
+    )
+
+
+def test_analysis_table_without_rows():
+    table = report_generator._create_analysis_table(_analysis_frame().iloc[:0], "GPU")
+
+    assert table == "### GPU\n\n*No data to display*\n\n"
+
+
+def test_box_stats_match_matplotlib():
+    values = np.array([1.0, 2.0, 3.0, 4.0, np.nan, 100.0])
+
+    stats = report_generator._box_stats(values)
+
+    assert stats["med"] == 3.0
+    assert (stats["q1"], stats["q3"]) == (2.0, 4.0)
+    assert (stats["whislo"], stats["whishi"]) == (1.0, 4.0)
+    assert stats["fliers"].tolist() == [100.0]
+
+
+def test_box_stats_of_empty_or_all_nan_column():
+    for values in (np.array([]), np.array([np.nan, np.nan])):
+        stats = report_generator._box_stats(values)
+
+        assert np.isnan([stats[key] for key in ("med", "q1", "q3", "mean")]).all()
+        assert np.isnan([stats["whislo"], stats["whishi"]]).all()
+        assert stats["fliers"].size == 0
+
+
+def _csv_outputs(directory):
+    """CSV variants on disk, by file name, with gzip files decompressed"""
+    outputs = {}
+    for path in directory.iterdir():
+        if path.name.endswith(".csv"):
+            outputs[path.name] = path.read_text()
+        elif path.name.endswith(".csv.gz"):
+            outputs[path.name] = gzip.decompress(path.read_bytes()).decode()
+    return outputs
+
+
+def test_arrow_csv_follows_gzip_threshold_and_removes_stale_variant(
+    tmp_path, monkeypatch
+):
+    pytest.importorskip("pyarrow")
+    monkeypatch.chdir(tmp_path)
+    frame = pd.DataFrame({"name": ["a", "b"], "fps": [30.5, 40.0]})
+    arrow_text = '"name","fps"\n"a",30.5\n"b",40\n'
+
+    monkeypatch.setattr(config, "ARROW_CSV", False)
+    monkeypatch.setattr(config, "CSV_GZIP_MIN_BYTES", 1)
+    report_generator._write_csv(frame, "out.csv")
+    assert _csv_outputs(tmp_path) == {"out.csv.gz": frame.to_csv(index=False)}
+
+    monkeypatch.setattr(config, "ARROW_CSV", True)
+    monkeypatch.setattr(config, "CSV_GZIP_MIN_BYTES", None)
+    report_generator._write_csv(frame, "out.csv")
+    assert _csv_outputs(tmp_path) == {"out.csv": arrow_text}
+
+    monkeypatch.setattr(config, "CSV_GZIP_MIN_BYTES", 1)
+    report_generator._write_csv(frame, "out.csv")
+    assert _csv_outputs(tmp_path) == {"out.csv.gz": arrow_text}
+
+
+def test_csv_is_rewritten_after_switching_writers_back(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "CSV_GZIP_MIN_BYTES", None)
+    frame = pd.DataFrame({"name": ["a", "b"], "fps": [30.5, 40.0]})
+
+    for arrow_csv in (False, True, False):
+        monkeypatch.setattr(config, "ARROW_CSV", arrow_csv)
+        report_generator._write_csv(frame, "out.csv")
+
+    assert (tmp_path / "out.csv").read_text() == frame.to_csv(index=False)
+
+
+def test_write_if_changed_skips_only_files_matching_their_sidecar(tmp_path):
+    path = str(tmp_path / "report.md")
+
+    assert report_generator._write_if_changed(path, b"report")
+    assert not report_generator._write_if_changed(path, b"report")
+
+    # Rewritten behind the sidecar's back, e.g. by an older version
+    (tmp_path / "report.md").write_bytes(b"other content")
+    assert report_generator._write_if_changed(path, b"report")
+    assert (tmp_path / "report.md").read_bytes() == b"report"
+
+
+def test_section_cache_key_follows_row_order(monkeypatch):
+    monkeypatch.setattr(report_generator, "_section_cache", OrderedDict())
+    frame = _analysis_frame()
+    analysis = {"improved": frame, "worsened": frame.iloc[:0]}
+    reordered = {"improved": frame.iloc[::-1], "worsened": frame.iloc[:0]}
+
+    first = report_generator._cached_section(
+        report_generator._build_device_analysis_section, analysis, "plots"
+    )
+    second = report_generator._cached_section(
+        report_generator._build_device_analysis_section, reordered, "plots"
+    )
+
+    assert first != second
+    assert second == report_generator._build_device_analysis_section(
+        reordered, "plots"
+    )
+
+
+def test_section_cache_reuses_text_and_stays_bounded(monkeypatch):
+    monkeypatch.setattr(report_generator, "_section_cache", OrderedDict())
+    calls = []
+
+    def builder(frame):
+        calls.append(frame)
+        return f"rows: {len(frame)}"
+
+    frame = _analysis_frame()
+    assert report_generator._cached_section(builder, frame) == "rows: 2"
+    assert report_generator._cached_section(builder, frame.copy()) == "rows: 2"
+    assert len(calls) == 1
+
+    for rows in range(report_generator.SECTION_CACHE_SIZE + 1):
+        report_generator._cached_section(builder, pd.DataFrame({"x": range(rows)}))
+    cache_size = len(report_generator._section_cache)
+    assert cache_size == report_generator.SECTION_CACHE_SIZE